@@ -441,10 +441,7 @@ async def _run_sync(
                 bold=True,
             )
             analyzer = DeepAnalysisService(debug=debug)
-            analyses = []
-            for movie in not_in_library:
-                analysis = await analyzer.analyze_movie(movie)
-                analyses.append(analysis)
+            analyses = await analyzer.analyze_movies(not_in_library)
 
             # Display analysis results
             typer.echo()
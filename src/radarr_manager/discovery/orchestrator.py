@@ -122,6 +122,7 @@ class Orchestrator:
         prompt: DiscoveryPrompt,
         limit: int | None = None,
         region: str | None = None,
+        partial: list[ParsedMovie] | None = None,
     ) -> DiscoveryResult:
         """
         Execute discovery based on the prompt configuration.
@@ -130,6 +131,8 @@ class Orchestrator:
             prompt: Discovery prompt configuration
             limit: Override limit from prompt
             region: Override region variable
+            partial: Caller-owned list that receives raw movies as each source
+                completes, so they can be recovered if the run is cancelled
 
         Returns:
             DiscoveryResult with movie suggestions
@@ -157,10 +160,12 @@ class Orchestrator:
         sources_used: list[str] = []
         fetch_stats: dict[str, int] = {"total": 0, "success": 0, "failed": 0}
         fallback_used = False
+        if partial is None:
+            partial = []
 
         # Phase 1: Execute fetch agents in parallel
         if scrape_sources and self._config.has_scraper:
-            fetched = await self._execute_fetches(scrape_sources)
+            fetched = await self._execute_fetches(scrape_sources, partial)
             all_movies.extend(fetched["movies"])
             fetch_stats = fetched["stats"]
             sources_used.extend(fetched["sources"])
@@ -179,6 +184,7 @@ class Orchestrator:
         if search_sources and self._config.has_llm:
             searched = await self._execute_web_search(search_sources, prompt, effective_limit)
             all_movies.extend(searched)
+            partial.extend(searched)
             sources_used.append("llm_web_search")
             self._log(f"Web search found {len(searched)} movies")
 
@@ -235,7 +241,16 @@ class Orchestrator:
             fallback_used=fallback_used,
         )
 
-    async def _execute_fetches(self, sources: list) -> dict[str, Any]:
+    def partial_movies(self, partial: list[ParsedMovie], limit: int) -> list[Any]:
+        """
+        Merge the movies a discover() run collected into ``partial`` so far.
+
+        Used to return early when a caller's deadline expires before analysis
+        finishes. Results are deduplicated but not LLM-validated.
+        """
+        return self._simple_merge(list(partial), limit)
+
+    async def _execute_fetches(self, sources: list, partial: list[ParsedMovie]) -> dict[str, Any]:
         """Execute fetch agents in parallel for all scrape sources."""
 
         async def fetch_one(source) -> dict[str, Any]:
@@ -250,6 +265,7 @@ class Orchestrator:
             )
 
             result = await self._fetch_agent.execute(request)
+            partial.extend(result.movies)
 
             return {
                 "movies": result.movies,
@@ -2,20 +2,36 @@
 
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+import yaml
 
 from radarr_manager.discovery.prompt import DiscoveryPrompt
 
 PROMPTS_DIR = Path(__file__).parent
 
 
-def get_builtin_prompt(name: str) -> DiscoveryPrompt:
-    """Load a built-in discovery prompt by name."""
+@lru_cache(maxsize=32)
+def _load_prompt_data(name: str) -> dict[str, Any]:
+    """Read and parse a built-in prompt file once per process."""
     prompt_file = PROMPTS_DIR / f"{name}.yaml"
     if not prompt_file.exists():
         available = list_builtin_prompts()
         raise ValueError(f"Unknown prompt '{name}'. Available: {', '.join(available)}")
-    return DiscoveryPrompt.from_yaml(prompt_file)
+    with prompt_file.open("r") as f:
+        return yaml.safe_load(f)
+
+
+def get_builtin_prompt(name: str) -> DiscoveryPrompt:
+    """Load a built-in discovery prompt by name.
+
+    The YAML is parsed once and cached; each call returns a fresh DiscoveryPrompt
+    because the orchestrator mutates ``variables`` during discovery.
+    """
+    return DiscoveryPrompt.from_dict(copy.deepcopy(_load_prompt_data(name)))
 
 
 def list_builtin_prompts() -> list[str]:
@@ -1,8 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from .base import MovieDiscoveryProvider, ProviderError
 from .factory import build_provider
-from .openai import OpenAIProvider
-from .smart_agentic import SmartAgenticProvider
-from .static import StaticListProvider
+
+if TYPE_CHECKING:
+    from .openai import OpenAIProvider
+    from .smart_agentic import SmartAgenticProvider
+    from .static import StaticListProvider
+
+# Provider classes are resolved on first access to keep package import cheap.
+_LAZY_EXPORTS = {
+    "OpenAIProvider": ".openai",
+    "SmartAgenticProvider": ".smart_agentic",
+    "StaticListProvider": ".static",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "MovieDiscoveryProvider",
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import nullcontext
 from typing import TYPE_CHECKING
 
 from radarr_manager.discovery.orchestrator import Orchestrator, OrchestratorConfig
@@ -11,6 +13,7 @@ from radarr_manager.discovery.prompts import get_builtin_prompt, get_default_pro
 from radarr_manager.providers.base import MovieDiscoveryProvider, MovieSuggestion
 
 if TYPE_CHECKING:
+    from radarr_manager.discovery.parsers import ParsedMovie
     from radarr_manager.scrapers.base import ScraperProvider
 
 logger = logging.getLogger(__name__)
@@ -96,6 +99,7 @@ class AgenticProvider(MovieDiscoveryProvider):
         *,
         limit: int,
         region: str | None = None,
+        deadline_seconds: float | None = None,
     ) -> list[MovieSuggestion]:
         """
         Discover movies using the orchestrator and specialized agents.
@@ -103,29 +107,60 @@ class AgenticProvider(MovieDiscoveryProvider):
         Args:
             limit: Maximum number of movies to return
             region: Override region variable in prompt
+            deadline_seconds: Stop waiting after this many seconds and return the
+                movies fetched so far (deduplicated, not LLM-validated)
 
         Returns:
             List of movie suggestions
         """
-        if self._debug:
-            logger.info(f"[AGENTIC] Using prompt: {self._prompt.name}")
+        scraper = self._config.scraper
+        # Closes the scraper's connection pool once no other discovery is using it
+        async with scraper if scraper is not None else nullcontext():
+            return await self._discover(
+                limit=limit, region=region, deadline_seconds=deadline_seconds
+            )
+
+    async def _discover(
+        self, *, limit: int, region: str | None, deadline_seconds: float | None
+    ) -> list[MovieSuggestion]:
+        if self._debug and logger.isEnabledFor(logging.INFO):
+            logger.info("[AGENTIC] Using prompt: %s", self._prompt.name)
             logger.info(
-                f"[AGENTIC] Config: scraper={self._config.has_scraper}, llm={self._config.has_llm}"
+                "[AGENTIC] Config: scraper=%s, llm=%s",
+                self._config.has_scraper,
+                self._config.has_llm,
             )
 
-        result = await self._orchestrator.discover(
+        # Filled by the orchestrator as sources complete; owned by this call only
+        partial: list[ParsedMovie] = []
+        discovery = self._orchestrator.discover(
             prompt=self._prompt,
             limit=limit,
             region=region,
+            partial=partial,
         )
-
-        if self._debug:
+        if deadline_seconds is None:
+            result = await discovery
+        else:
+            try:
+                result = await asyncio.wait_for(discovery, timeout=deadline_seconds)
+            except TimeoutError:
+                movies = self._orchestrator.partial_movies(partial, limit)
+                if self._debug:
+                    logger.info(
+                        "[AGENTIC] Deadline of %ss reached, returning %d partial results",
+                        deadline_seconds,
+                        len(movies),
+                    )
+                return movies
+
+        if self._debug and logger.isEnabledFor(logging.INFO):
             logger.info("[AGENTIC] Discovery complete:")
-            logger.info(f"  - Fetch stats: {result.fetch_stats}")
-            logger.info(f"  - Analysis stats: {result.analysis_stats}")
-            logger.info(f"  - Fallback used: {result.fallback_used}")
-            logger.info(f"  - Total movies: {len(result.movies)}")
-            logger.info(f"  - Sources: {', '.join(result.sources_used)}")
+            logger.info("  - Fetch stats: %s", result.fetch_stats)
+            logger.info("  - Analysis stats: %s", result.analysis_stats)
+            logger.info("  - Fallback used: %s", result.fallback_used)
+            logger.info("  - Total movies: %d", len(result.movies))
+            logger.info("  - Sources: %s", ", ".join(result.sources_used))
 
         return result.movies
 
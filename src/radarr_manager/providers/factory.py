@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
 from radarr_manager.config import Settings
-from radarr_manager.providers.agentic import AgenticProvider
 from radarr_manager.providers.base import MovieDiscoveryProvider, ProviderError
-from radarr_manager.providers.hybrid import HybridDiscoveryProvider
-from radarr_manager.providers.openai import OpenAIProvider
-from radarr_manager.providers.smart_agentic import SmartAgenticProvider
-from radarr_manager.providers.static import StaticListProvider
-from radarr_manager.scrapers.factory import build_scraper
+
+# Provider modules are imported inside their builders so that e.g. a static run
+# does not pay for importing the OpenAI SDK, httpx and the agent stack.
+if TYPE_CHECKING:
+    from radarr_manager.providers.agentic import AgenticProvider
+    from radarr_manager.providers.hybrid import HybridDiscoveryProvider
+    from radarr_manager.providers.openai import OpenAIProvider
+    from radarr_manager.providers.smart_agentic import SmartAgenticProvider
+    from radarr_manager.providers.static import StaticListProvider
 
 
 def build_provider(
@@ -18,42 +24,39 @@ def build_provider(
 ) -> MovieDiscoveryProvider:
     """Construct a discovery provider based on configuration or CLI overrides."""
 
-    # Check for discovery mode override or setting
     discovery_mode = (override or settings.discovery_mode or "openai").lower()
 
-    # Legacy provider names map to discovery modes
-    if discovery_mode == "static":
-        return StaticListProvider()
-
-    if discovery_mode == "openai":
-        return OpenAIProvider(
-            api_key=settings.openai_api_key or "",
-            model=settings.openai_model,
-            region=settings.region,
-            cache_ttl_hours=settings.cache_ttl_hours,
-            debug=debug,
-        )
-
-    if discovery_mode == "hybrid":
-        return _build_hybrid_provider(settings, debug)
-
-    if discovery_mode == "scraper":
-        return _build_scraper_only_provider(settings, debug)
+    try:
+        builder = _BUILDERS[discovery_mode]
+    except KeyError:
+        raise ProviderError(
+            f"Discovery mode '{discovery_mode}' is not implemented. "
+            f"Valid modes: {', '.join(sorted(_BUILDERS))}"
+        ) from None
 
-    if discovery_mode == "agentic":
-        return _build_agentic_provider(settings, debug, prompt)
+    return builder(settings, debug, prompt)
 
-    if discovery_mode == "smart_agentic" or discovery_mode == "smart":
-        return _build_smart_agentic_provider(settings, debug, prompt)
 
-    raise ProviderError(
-        f"Discovery mode '{discovery_mode}' is not implemented. "
-        "Valid modes: openai, hybrid, scraper, agentic, smart_agentic, static"
+def _build_openai_provider(
+    settings: Settings, debug: bool, prompt: str | None = None
+) -> OpenAIProvider:
+    """Build the OpenAI web-search provider."""
+    from radarr_manager.providers.openai import OpenAIProvider
+
+    return OpenAIProvider(
+        api_key=settings.openai_api_key or "",
+        model=settings.openai_model,
+        region=settings.region,
+        cache_ttl_hours=settings.cache_ttl_hours,
+        debug=debug,
     )
 
 
 def _build_hybrid_provider(settings: Settings, debug: bool) -> HybridDiscoveryProvider:
     """Build hybrid provider with scraper + OpenAI."""
+    from radarr_manager.providers.hybrid import HybridDiscoveryProvider
+    from radarr_manager.scrapers.factory import build_scraper
+
     scraper = build_scraper(
         provider=settings.scraper_provider,
         api_url=settings.scraper_api_url,
@@ -63,13 +66,7 @@ def _build_hybrid_provider(settings: Settings, debug: bool) -> HybridDiscoveryPr
 
     openai_provider = None
     if settings.openai_api_key:
-        openai_provider = OpenAIProvider(
-            api_key=settings.openai_api_key,
-            model=settings.openai_model,
-            region=settings.region,
-            cache_ttl_hours=settings.cache_ttl_hours,
-            debug=debug,
-        )
+        openai_provider = _build_openai_provider(settings, debug)
 
     return HybridDiscoveryProvider(
         scraper=scraper,
@@ -80,6 +77,9 @@ def _build_hybrid_provider(settings: Settings, debug: bool) -> HybridDiscoveryPr
 
 def _build_scraper_only_provider(settings: Settings, debug: bool) -> HybridDiscoveryProvider:
     """Build scraper-only provider (no OpenAI)."""
+    from radarr_manager.providers.hybrid import HybridDiscoveryProvider
+    from radarr_manager.scrapers.factory import build_scraper
+
     scraper = build_scraper(
         provider=settings.scraper_provider,
         api_url=settings.scraper_api_url,
@@ -98,6 +98,9 @@ def _build_agentic_provider(
     settings: Settings, debug: bool, prompt: str | None = None
 ) -> AgenticProvider:
     """Build agentic provider with orchestrator + agents architecture."""
+    from radarr_manager.providers.agentic import AgenticProvider
+    from radarr_manager.scrapers.factory import build_scraper
+
     # Build scraper if configured
     scraper = None
     if settings.scraper_enabled or settings.scraper_api_url:
@@ -135,6 +138,8 @@ def _build_smart_agentic_provider(
     - Agents communicate via structured markdown reports
     - ValidatorAgent can enrich and filter via Radarr (early filtering)
     """
+    from radarr_manager.providers.smart_agentic import SmartAgenticProvider
+
     # Determine orchestrator model - use a smarter model for reasoning
     orchestrator_model = settings.openai_model or "gpt-4o"
     if orchestrator_model in ("gpt-4o-mini", "gpt-3.5-turbo"):
@@ -159,4 +164,27 @@ def _build_smart_agentic_provider(
     )
 
 
+def _build_static_provider(
+    settings: Settings, debug: bool, prompt: str | None = None
+) -> StaticListProvider:
+    """Build the offline static-list provider."""
+    from radarr_manager.providers.static import StaticListProvider
+
+    return StaticListProvider()
+
+
+_ProviderBuilder = Callable[[Settings, bool, str | None], MovieDiscoveryProvider]
+
+# Discovery mode -> builder. Legacy provider names map to discovery modes.
+_BUILDERS: dict[str, _ProviderBuilder] = {
+    "static": _build_static_provider,
+    "openai": _build_openai_provider,
+    "hybrid": lambda settings, debug, prompt: _build_hybrid_provider(settings, debug),
+    "scraper": lambda settings, debug, prompt: _build_scraper_only_provider(settings, debug),
+    "agentic": _build_agentic_provider,
+    "smart_agentic": _build_smart_agentic_provider,
+    "smart": _build_smart_agentic_provider,
+}
+
+
 __all__ = ["build_provider"]
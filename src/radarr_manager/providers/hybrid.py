@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from datetime import date
 from typing import Any
 
 from radarr_manager.models import MovieSuggestion
@@ -13,6 +15,23 @@ from radarr_manager.scrapers.base import ScrapedMovie, ScraperProvider
 logger = logging.getLogger(__name__)
 
 
+class _PunctuationTable(dict[int, int | None]):
+    """str.translate table that drops every code point except letters, digits and spaces.
+
+    Entries are filled lazily on first sight, so titles (mostly ASCII) only ever
+    populate a few dozen keys instead of the whole Unicode range.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char.isspace() else None
+        self[codepoint] = value
+        return value
+
+
+_STRIP_PUNCTUATION = _PunctuationTable()
+
+
 class HybridDiscoveryProvider(MovieDiscoveryProvider):
     """
     Hybrid discovery that combines web scraping with LLM enrichment.
@@ -49,28 +68,16 @@ class HybridDiscoveryProvider(MovieDiscoveryProvider):
         if self._debug:
             logger.info("[HYBRID] Starting hybrid discovery...")
 
-        # Step 1: Get reliable titles from scraper
-        scraped_movies = await self._scrape_titles()
+        # Steps 1 and 2 are independent network round trips, so run them concurrently:
+        # reliable titles from the scraper, additional discoveries from OpenAI (if available)
+        scraped_movies, openai_suggestions = await asyncio.gather(
+            self._scrape_titles(),
+            self._discover_openai(limit=limit, region=region),
+        )
 
         if self._debug:
             logger.info(f"[HYBRID] Scraper found {len(scraped_movies)} movies")
 
-        # Step 2: Get additional discoveries from OpenAI (if available)
-        openai_suggestions: list[MovieSuggestion] = []
-        if self._openai:
-            try:
-                openai_suggestions = await self._openai.discover(
-                    limit=limit, region=region
-                )
-                if self._debug:
-                    logger.info(
-                        f"[HYBRID] OpenAI found {len(openai_suggestions)} movies"
-                    )
-            except ProviderError as exc:
-                if self._debug:
-                    logger.warning(f"[HYBRID] OpenAI discovery failed: {exc}")
-                # Continue with just scraped movies
-
         # Step 3: Convert scraped movies to suggestions
         scraped_suggestions = [
             self._scraped_to_suggestion(movie) for movie in scraped_movies
@@ -90,21 +97,43 @@ class HybridDiscoveryProvider(MovieDiscoveryProvider):
 
         return merged
 
+    async def _discover_openai(
+        self, *, limit: int, region: str | None
+    ) -> list[MovieSuggestion]:
+        """Get additional discoveries from OpenAI, or nothing if unavailable."""
+        if not self._openai:
+            return []
+        try:
+            suggestions = await self._openai.discover(limit=limit, region=region)
+        except ProviderError as exc:
+            if self._debug:
+                logger.warning(f"[HYBRID] OpenAI discovery failed: {exc}")
+            # Continue with just scraped movies
+            return []
+        if self._debug:
+            logger.info(f"[HYBRID] OpenAI found {len(suggestions)} movies")
+        return suggestions
+
     async def _scrape_titles(self) -> list[ScrapedMovie]:
         """Scrape movie titles from all configured sources."""
         try:
-            return await self._scraper.discover_all()
+            # Closes the scraper's connection pool once no other discovery is using it
+            async with self._scraper:
+                return await self._scraper.discover_all()
         except Exception as exc:
             if self._debug:
                 logger.warning(f"[HYBRID] Scraper error: {exc}")
             return []
 
     def _scraped_to_suggestion(self, movie: ScrapedMovie) -> MovieSuggestion:
-        """Convert a scraped movie to a MovieSuggestion."""
+        """Convert a scraped movie to a MovieSuggestion.
+
+        Scraper output is already typed, so the model is built without validation.
+        """
         # Build release date from year if available
-        release_date = f"{movie.year}-01-01" if movie.year else None
+        release_date = date(movie.year, 1, 1) if movie.year else None
 
-        return MovieSuggestion(
+        return MovieSuggestion.model_construct(
             title=movie.title,
             release_date=release_date,
             overview=None,  # Will be enriched later via Radarr lookup
@@ -140,13 +169,11 @@ class HybridDiscoveryProvider(MovieDiscoveryProvider):
             if normalized not in seen_titles:
                 seen_titles.add(normalized)
                 # Mark as scraper-exclusive discovery
-                suggestion = MovieSuggestion(
-                    title=suggestion.title,
-                    release_date=suggestion.release_date,
-                    overview=suggestion.overview,
-                    franchise=suggestion.franchise,
-                    confidence=0.80,  # Slightly lower since OpenAI didn't find it
-                    sources=["scraper-exclusive"] + suggestion.sources,
+                suggestion = suggestion.model_copy(
+                    update={
+                        "confidence": 0.80,  # Slightly lower since OpenAI didn't find it
+                        "sources": ["scraper-exclusive"] + suggestion.sources,
+                    }
                 )
                 result.append(suggestion)
 
@@ -172,7 +199,7 @@ class HybridDiscoveryProvider(MovieDiscoveryProvider):
                 normalized = normalized[: -len(suffix)].strip()
 
         # Remove special characters for fuzzy matching
-        normalized = "".join(c for c in normalized if c.isalnum() or c.isspace())
+        normalized = normalized.translate(_STRIP_PUNCTUATION)
         normalized = " ".join(normalized.split())  # Normalize whitespace
 
         return normalized
@@ -1,59 +1,284 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
 import re
-from datetime import UTC, datetime
+import tempfile
+import time
+import weakref
+from collections.abc import AsyncIterator, Iterable
+from datetime import UTC, date, datetime
+from functools import cache, lru_cache
+from itertools import chain
+from pathlib import Path
 from typing import Any
 
-from openai import AsyncOpenAI
+import httpx
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from pydantic import TypeAdapter, ValidationError
 
 from radarr_manager.models import MovieSuggestion
 from radarr_manager.providers.base import MovieDiscoveryProvider, ProviderError
 
 logger = logging.getLogger(__name__)
 
-SYSTEM_PROMPT = (
-    "You are a film research assistant. Always return a single JSON object with a 'suggestions' array. "
-    "Each element MUST include: title, release_date (YYYY-MM-DD or null), overview (brief plot summary), "
-    "franchise (franchise name or null), confidence (0-1 based on how well it matches criteria), "
-    "sources (array of outlet names where you found info). "
-    "IMPORTANT - TITLE FORMAT: Use the EXACT official title as it appears on IMDB or TMDB. "
-    "Do NOT add clarifying suffixes like '(live-action)', '(remake)', '(reboot)', '(2025)', or similar. "
-    "For example: use 'How to Train Your Dragon' not 'How to Train Your Dragon (live-action)'. "
-    "The year in release_date field is sufficient to distinguish remakes from originals. "
-    "NOTE: Do NOT include ratings/metadata - ratings will be fetched separately from authoritative sources. "
-    'Example format: {"suggestions": [{"title": "Movie Title", "release_date": "2025-08-15", '
-    '"overview": "Brief plot description...", "franchise": "Franchise Name", "confidence": 0.9, '
-    '"sources": ["IMDb", "Wikipedia"]}]} '
-    "Focus on major film releases from the past three months or the next four months that have strong commercial momentum. "
-    "Include: blockbusters, franchises (Marvel, DC, Disney, Universal, Warner Bros), prestige films from theatrical distributors "
-    "(Lionsgate, A24, Sony Pictures, Neon, Searchlight, Focus Features, Aura Entertainment, IFC, Bleecker Street) AND premium streaming "
-    "(Netflix, Apple TV+, Amazon/MGM, Max, Hulu originals with 80%+ RT or award buzz), plus well-reviewed mid-budget releases "
-    "(IMDb 7.0+/RT 60%+) with recognizable casts, including action-comedies, dramedies, and genre films. Prioritize quality over budget. "
-    "OSCAR PRIORITY: STRONGLY prioritize movies starring Oscar winners OR nominees for Best Actor/Actress, Best Director, or Best Picture. "
-    "Also prioritize acclaimed literary adaptations from respected authors. "
-    "Examples of Best Actor winners to prioritize: Brendan Fraser, Will Smith, Anthony Hopkins, Gary Oldman, Casey Affleck, "
-    "Leonardo DiCaprio, Eddie Redmayne, Matthew McConaughey, Daniel Day-Lewis, Colin Firth, Jeff Bridges, Sean Penn, Forest Whitaker, "
-    "Philip Seymour Hoffman, Jamie Foxx, Denzel Washington, Russell Crowe, Tom Hanks, Al Pacino, Nicolas Cage, Cillian Murphy. "
-    "Examples of Best Actress winners to prioritize: Michelle Yeoh, Jessica Chastain, Frances McDormand, Olivia Colman, Emma Stone, "
-    "Brie Larson, Julianne Moore, Cate Blanchett, Jennifer Lawrence, Natalie Portman, Sandra Bullock, Kate Winslet, Marion Cotillard, "
-    "Helen Mirren, Reese Witherspoon, Charlize Theron, Nicole Kidman, Halle Berry, Julia Roberts, Gwyneth Paltrow. "
-    "QUALITY REQUIREMENTS: For released movies, only suggest those with IMDb 6.5+/10 or RT 60%+. "
-    "For PRE-RELEASE movies (no ratings yet), include them if they meet ANY of these criteria: "
-    "(1) Major studio tentpole/franchise film, (2) A-list cast or acclaimed director, (3) Strong marketing buzz or trailer views, "
-    "(4) Based on bestselling book/successful IP, (5) Award season contender, (6) Wide theatrical release confirmed. "
-    "EXCLUDE: (1) low-budget regional films, (2) direct-to-streaming B-movies (NOT prestige streaming like Netflix/Apple originals), "
-    "(3) poorly received sequels, (4) RE-RELEASES of old movies (anniversary editions, director's cuts, combined cuts of old films), "
-    "(5) concert films, documentary compilations, or clip compilations. "
-    "CRITICAL: Only suggest genuinely NEW movies (original release within past 3 months or upcoming). Do NOT suggest classic films getting theatrical re-runs. "
-    "NO Bollywood, Nollywood, or other regional cinema unless they have exceptional global critical acclaim (8.0+ IMDb). "
-    "Prioritize: Oscar-winning actors, major studio releases, acclaimed directors, franchise films, award contenders, prestige dramas/thrillers. "
-    "Every suggestion must have genuine mainstream appeal and critical/audience approval (or strong pre-release anticipation). "
-    "Return raw JSON only—no markdown, explanations, or keys outside the schema."
+CACHE_DIR_ENV = "RADARR_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "radarr_manager" / "openai"
+
+_DECODER = json.JSONDecoder()
+
+# In-process tier in front of the disk cache: cache key -> (stored_at, suggestions)
+_RESPONSE_CACHE: dict[str, tuple[float, tuple[MovieSuggestion, ...]]] = {}
+_SUGGESTIONS_ADAPTER = TypeAdapter(list[MovieSuggestion])
+
+# Kept in a text file (one directive per line) and read on first use
+SYSTEM_PROMPT_PATH = Path(__file__).with_name("openai_system_prompt.txt")
+
+
+@cache
+def _system_prompt() -> str:
+    """Return the system prompt, reading it from disk once per process."""
+    return " ".join(SYSTEM_PROMPT_PATH.read_text(encoding="utf-8").splitlines())
+
+
+@cache
+def _system_message() -> dict[str, Any]:
+    """Return the system message, built once: it is identical for every request."""
+    return {"role": "system", "content": [{"type": "input_text", "text": _system_prompt()}]}
+
+
+def __getattr__(name: str) -> Any:
+    # SYSTEM_PROMPT stays importable without loading the file at import time
+    if name == "SYSTEM_PROMPT":
+        return _system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Structured output schema mirroring the wire shape of MovieSuggestion. Strict mode
+# requires every property to be listed as required, so optional fields are nullable.
+_RESPONSE_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "name": "movie_suggestions",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "suggestions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string"},
+                        "release_date": {"type": ["string", "null"]},
+                        "overview": {"type": ["string", "null"]},
+                        "franchise": {"type": ["string", "null"]},
+                        "confidence": {"type": "number"},
+                        "sources": {"type": "array", "items": {"type": "string"}},
+                    },
+                    "required": [
+                        "title",
+                        "release_date",
+                        "overview",
+                        "franchise",
+                        "confidence",
+                        "sources",
+                    ],
+                    "additionalProperties": False,
+                },
+            }
+        },
+        "required": ["suggestions"],
+        "additionalProperties": False,
+    },
+}
+
+_TOOLS: list[dict[str, Any]] = [{"type": "web_search"}]
+
+# Payloads up to this many suggestions are validated on the event loop
+_INLINE_VALIDATION_MAX = 100
+
+# Stable instruction block sent ahead of the per-call tail so OpenAI's prompt cache
+# can reuse it; only the short suffix built in _build_prompt varies between calls.
+USER_PROMPT_PREFIX = (
+    "Use web_search to find movies from these sources: "
+    "(1) https://www.rottentomatoes.com/browse/movies_in_theaters - currently in theaters, "
+    "(2) https://www.rottentomatoes.com/browse/movies_at_home/sort:popular - trending streaming/home releases, "
+    "(3) https://www.imdb.com/search/title/?title_type=feature&moviemeter=,50 - IMDb most popular movies right now. "
+    "Also search IMDb release calendars and movie news sites. "
+    "Include theatrical releases, blockbusters, franchise films, prestige films, AND high-quality streaming releases. "
+    "PRIORITIZE movies featuring Academy Award winners/nominees. "
+    "Return ONLY: title, release_date, overview, franchise (if applicable), confidence, and sources. "
+    "Do NOT include any ratings or IDs - those will be fetched separately."
 )
 
 
+def _validate_suggestions(items: list[Any]) -> tuple[list[MovieSuggestion], list[str]]:
+    """Validate raw suggestion dicts, returning the valid models and per-item errors."""
+    # Cheap structural pre-filter so malformed entries never reach pydantic
+    candidates: list[dict[str, Any]] = []
+    errors: list[str] = []
+    for item in items:
+        if not isinstance(item, dict):
+            errors.append(f"Unknown: expected an object, got {type(item).__name__}")
+        elif not item.get("title"):
+            errors.append("Unknown: missing title")
+        else:
+            candidates.append(item)
+
+    try:
+        # Common case: every candidate is valid and validates in one pydantic-core call
+        return _SUGGESTIONS_ADAPTER.validate_python(candidates), errors
+    except ValidationError as exc:
+        # loc[0] is the list index of the failing candidate; group messages per item
+        failures: dict[int, list[str]] = {}
+        for error in exc.errors():
+            index, *field = error["loc"]
+            location = ".".join(str(part) for part in field) or "item"
+            failures.setdefault(int(index), []).append(f"{location}: {error['msg']}")
+
+    errors.extend(
+        f"{candidates[index]['title']}: {'; '.join(messages)}"
+        for index, messages in sorted(failures.items())
+    )
+    remaining = [item for index, item in enumerate(candidates) if index not in failures]
+    return _SUGGESTIONS_ADAPTER.validate_python(remaining), errors
+
+
+_CITATION_RE = re.compile(r"【[^】]*】")
+_BRACKET_CITATION_RE = re.compile(r"\[citation[^\]]*\]", re.IGNORECASE)
+
+
+def _strip_citations(text: str) -> str:
+    """Remove OpenAI citation markers like 【4:0†source】 or [citation]."""
+    # Substring checks skip the regex scans entirely on clean (common) responses
+    if "【" in text:
+        text = _CITATION_RE.sub("", text)
+    if "[" in text:
+        text = _BRACKET_CITATION_RE.sub("", text)
+    return text
+
+
+def _dedupe_suggestions(suggestions: Iterable[MovieSuggestion]) -> list[MovieSuggestion]:
+    """Drop repeated (title, release date) pairs, keeping the first occurrence in order."""
+    unique: dict[tuple[str, date | None], MovieSuggestion] = {}
+    for suggestion in suggestions:
+        unique.setdefault((suggestion.title.casefold(), suggestion.release_date), suggestion)
+    return list(unique.values())
+
+
+@lru_cache(maxsize=256)
+def _build_user_prompt(hour_bucket: int, limit: int, region: str) -> str:
+    """Return the user prompt for an hour bucket (hours since the epoch)."""
+    # Hour granularity so repeated runs within the hour send an identical prompt
+    timestamp = datetime.fromtimestamp(hour_bucket * 3600, UTC).strftime("%Y-%m-%d %H:00 UTC")
+    return (
+        f"{USER_PROMPT_PREFIX}\n---\n" f"As of {timestamp}. Max {limit} movies for region {region}."
+    )
+
+
+class _SuggestionStreamParser:
+    """
+    Incrementally extract ``suggestions`` items from streamed JSON text.
+
+    Tracks container nesting outside string literals and emits each object that
+    closes directly inside the root object's ``suggestions`` array. Anything
+    before the root object (markdown fences, prose) is ignored.
+    """
+
+    def __init__(self) -> None:
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_string = ""
+        self._array_key: str | None = None
+        self._item_start: int | None = None
+        self._text = ""
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """Consume a text delta and return the suggestion dicts completed by it."""
+        offset = len(self._text)
+        self._text += chunk
+        completed: list[dict[str, Any]] = []
+
+        for index in range(offset, len(self._text)):
+            char = self._text[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1:
+                        self._last_string = self._text[self._string_start : index]
+                continue
+
+            if char == '"' and self._stack:
+                self._in_string = True
+                self._string_start = index + 1
+            elif char in "{[":
+                if char == "[" and len(self._stack) == 1:
+                    self._array_key = self._last_string
+                elif char == "{" and self._stack == ["{", "["]:
+                    self._item_start = index
+                self._stack.append(char)
+            elif char in "}]" and self._stack:
+                self._stack.pop()
+                if char == "}" and self._stack == ["{", "["] and self._item_start is not None:
+                    if self._array_key == "suggestions":
+                        item = self._decode(self._text[self._item_start : index + 1])
+                        if item is not None:
+                            completed.append(item)
+                    self._item_start = None
+
+        # Drop consumed text that can no longer be part of a pending item
+        keep_from = self._item_start if self._item_start is not None else len(self._text)
+        if self._in_string and self._string_start < keep_from:
+            keep_from = self._string_start
+        if keep_from:
+            self._text = self._text[keep_from:]
+            if self._item_start is not None:
+                self._item_start -= keep_from
+            self._string_start -= keep_from
+        return completed
+
+    @staticmethod
+    def _decode(raw: str) -> dict[str, Any] | None:
+        try:
+            item = orjson.loads(_strip_citations(raw))
+        except orjson.JSONDecodeError:
+            return None
+        return item if isinstance(item, dict) else None
+
+
+# httpx connection pools are bound to the event loop that created them, so clients
+# are shared per (loop, API key) and dropped together with their loop.
+_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, AsyncOpenAI]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_client(api_key: str) -> AsyncOpenAI:
+    """Return the pooled HTTP/2 client for ``api_key`` on the running event loop."""
+    clients = _CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=DefaultAsyncHttpxClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            ),
+        )
+        clients[api_key] = client
+    return client
+
+
 class OpenAIProvider(MovieDiscoveryProvider):
     """Discovery provider that queries OpenAI with web search enabled."""
 
@@ -67,140 +292,329 @@ class OpenAIProvider(MovieDiscoveryProvider):
         region: str | None,
         cache_ttl_hours: int,
         client: AsyncOpenAI | None = None,
+        cache_dir: Path | None = None,
         debug: bool = False,
     ) -> None:
         if not api_key:
             raise ProviderError("OPENAI_API_KEY is required for the OpenAI provider")
 
-        self._client = client or AsyncOpenAI(api_key=api_key)
+        # Without an explicit client, a pooled one is resolved per event loop at call time
+        self._client = client
+        self._api_key = api_key
         self._model = model or "gpt-4o-mini"
         self._region = region
         self._cache_ttl_hours = cache_ttl_hours
+        self._cache_dir = cache_dir or Path(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+        self._inflight: dict[str, asyncio.Future[list[MovieSuggestion]]] = {}
         self._debug = debug
 
     async def discover(self, *, limit: int, region: str | None = None) -> list[MovieSuggestion]:
         target_region = region or self._region or "US"
         prompt = self._build_prompt(limit=limit, region=target_region)
 
-        if self._debug:
-            logger.info(f"[DEBUG] Requesting {limit} movie suggestions from OpenAI ({self._model})")
-            logger.info(f"[DEBUG] Region: {target_region}")
+        key = self._cache_key(limit=limit, region=target_region)
+
+        # Singleflight: concurrent identical calls share the first caller's request
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return list(await asyncio.shield(inflight))
 
+        future: asyncio.Future[list[MovieSuggestion]] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            response = await self._client.responses.create(
-                model=self._model,
-                input=[
-                    {
-                        "role": "system",
-                        "content": [
-                            {"type": "input_text", "text": SYSTEM_PROMPT},
-                        ],
-                    },
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "input_text", "text": prompt},
-                        ],
-                    },
-                ],
-                tools=[{"type": "web_search"}],
-                temperature=0.3,
-                max_output_tokens=4096,
+            suggestions = await self._cached_request(
+                key, limit=limit, region=target_region, prompt=prompt
+            )
+        except asyncio.CancelledError:
+            # Only the leader was cancelled; waiters get an ordinary provider failure
+            future.set_exception(ProviderError("Shared OpenAI request was cancelled"))
+            future.exception()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # Mark retrieved so a waiter-less failure isn't logged twice
+            raise
+        else:
+            future.set_result(suggestions)
+            return suggestions
+        finally:
+            self._inflight.pop(key, None)
+
+    async def discover_parallel(self, *, limit: int, regions: list[str]) -> list[MovieSuggestion]:
+        """
+        Split ``limit`` across ``regions`` and query them concurrently.
+
+        Results are merged in region order and deduplicated by title and release
+        date. Like ``discover``, the merged list is not truncated to ``limit``.
+        Regions that fail are skipped; if every region fails the first error is raised.
+        """
+        if not regions:
+            return await self.discover(limit=limit)
+
+        shard_limit = limit // len(regions) + 1
+        results = await asyncio.gather(
+            *(self.discover(limit=shard_limit, region=region) for region in regions),
+            return_exceptions=True,
+        )
+
+        succeeded: list[list[MovieSuggestion]] = []
+        errors: list[BaseException] = []
+        for region, result in zip(regions, results, strict=True):
+            if isinstance(result, BaseException):
+                errors.append(result)
+                if self._debug:
+                    logger.warning("[DEBUG] Discovery for region %s failed: %s", region, result)
+                continue
+            succeeded.append(result)
+
+        if not succeeded:
+            raise errors[0]
+        return _dedupe_suggestions(chain.from_iterable(succeeded))
+
+    def _cache_key(self, *, limit: int, region: str) -> str:
+        """Key a request by its parameters and static prompts."""
+        # The user prompt's hour timestamp is left out so entries live for the full TTL
+        parts = (self._model, region, str(limit), _system_prompt(), USER_PROMPT_PREFIX)
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+    async def _cached_request(
+        self, key: str, *, limit: int, region: str, prompt: str
+    ) -> list[MovieSuggestion]:
+        """Serve ``key`` from the in-process or disk cache, or request and store it."""
+        if self._cache_ttl_hours > 0:
+            ttl_seconds = self._cache_ttl_hours * 3600
+            entry = _RESPONSE_CACHE.get(key)
+            if entry is None:
+                entry = self._read_cache(key)
+                if entry is not None:
+                    _RESPONSE_CACHE[key] = entry
+            if entry is not None and time.time() - entry[0] < ttl_seconds:
+                cached = list(entry[1])
+                if self._debug:
+                    logger.info("[DEBUG] Using %d cached suggestions (%.12s)", len(cached), key)
+                return cached
+
+        suggestions = await self._request_suggestions(limit=limit, region=region, prompt=prompt)
+        if self._cache_ttl_hours > 0:
+            now = time.time()
+            # Evict stale entries so a long-running server doesn't accumulate old hours
+            for stale in [k for k, (ts, _) in _RESPONSE_CACHE.items() if now - ts >= ttl_seconds]:
+                del _RESPONSE_CACHE[stale]
+            _RESPONSE_CACHE[key] = (now, tuple(suggestions))
+            self._write_cache(key, suggestions)
+        return suggestions
+
+    async def discover_stream(
+        self, *, limit: int, region: str | None = None
+    ) -> AsyncIterator[MovieSuggestion]:
+        """
+        Stream suggestions as soon as each one is complete in the model output.
+
+        Unlike ``discover`` this bypasses the response cache and request coalescing,
+        so callers can start acting on the first movies while generation continues.
+        """
+        target_region = region or self._region or "US"
+        prompt = self._build_prompt(limit=limit, region=target_region)
+        parser = _SuggestionStreamParser()
+
+        try:
+            stream = await self._get_client().responses.create(
+                **self._request_params(prompt), stream=True
             )
         except Exception as exc:  # pragma: no cover - depends on network APIs
             raise ProviderError(f"OpenAI request failed: {exc}") from exc
 
+        async for event in stream:
+            if event.type in ("response.failed", "response.incomplete"):
+                # Fail like the non-streaming path instead of ending with a partial list
+                self._raise_for_status(getattr(event, "response", None))
+                raise ProviderError(f"OpenAI stream ended with {event.type}")
+            if event.type == "error":
+                raise ProviderError(f"OpenAI stream error: {getattr(event, 'message', event)}")
+            if event.type != "response.output_text.delta":
+                continue
+            for item in parser.feed(event.delta):
+                try:
+                    yield MovieSuggestion.model_validate(item)
+                except ValidationError as exc:
+                    title = item.get("title", "Unknown")
+                    if not self._debug:
+                        raise ProviderError(f"Invalid suggestion payload: {title}: {exc}") from exc
+                    logger.warning("[DEBUG] Validation failed for: %s: %s", title, exc)
+
+    def _get_client(self) -> AsyncOpenAI:
+        return self._client or _shared_client(self._api_key)
+
+    def _request_params(self, prompt: str) -> dict[str, Any]:
+        """Keyword arguments for ``responses.create`` shared by both discovery paths."""
+        return {
+            "model": self._model,
+            # Only the user message varies; the system message and tools are shared
+            "input": [
+                _system_message(),
+                {"role": "user", "content": [{"type": "input_text", "text": prompt}]},
+            ],
+            "tools": _TOOLS,
+            "text": {"format": _RESPONSE_FORMAT},
+            "temperature": 0.3,
+            "max_output_tokens": 4096,
+        }
+
+    async def _request_suggestions(
+        self, *, limit: int, region: str, prompt: str
+    ) -> list[MovieSuggestion]:
+        """Query OpenAI and validate the returned suggestions."""
+        if self._debug:
+            logger.info(
+                "[DEBUG] Requesting %d movie suggestions from OpenAI (%s)", limit, self._model
+            )
+            logger.info("[DEBUG] Region: %s", region)
+
+        try:
+            response = await self._get_client().responses.create(**self._request_params(prompt))
+        except Exception as exc:  # pragma: no cover - depends on network APIs
+            raise ProviderError(f"OpenAI request failed: {exc}") from exc
+
         payload = self._extract_json(response)
         suggestions_data = payload.get("suggestions", [])
 
         if self._debug:
-            logger.info(f"[DEBUG] LLM returned {len(suggestions_data)} suggestions")
+            logger.info("[DEBUG] LLM returned %d suggestions", len(suggestions_data))
 
-        suggestions: list[MovieSuggestion] = []
-        validation_errors = []
-        for item in suggestions_data:
-            try:
-                suggestion = MovieSuggestion.model_validate(item)
-                suggestions.append(suggestion)
-            except Exception as exc:  # pragma: no cover - validation errors bubble to user
-                validation_errors.append(f"{item.get('title', 'Unknown')}: {exc}")
-                if self._debug:
-                    logger.warning(
-                        f"[DEBUG] Validation failed for: {item.get('title', 'Unknown')} - {exc}"
-                    )
+        # Large payloads are validated off the event loop so concurrent I/O keeps
+        # flowing; small ones are cheaper inline than the thread hop
+        if len(suggestions_data) > _INLINE_VALIDATION_MAX:
+            suggestions, validation_errors = await asyncio.to_thread(
+                _validate_suggestions, suggestions_data
+            )
+        else:
+            suggestions, validation_errors = _validate_suggestions(suggestions_data)
+        if self._debug:
+            for error in validation_errors:
+                logger.warning("[DEBUG] Validation failed for: %s", error)
 
         if validation_errors and not self._debug:
             raise ProviderError(f"Invalid suggestion payload: {validation_errors[0]}")
 
+        suggestions = _dedupe_suggestions(suggestions)
+
         # Don't truncate - accept all valid suggestions from OpenAI
         # The limit in the prompt is guidance; downstream filtering (library check,
         # quality analysis) will handle the actual selection
-        if self._debug:
+        if self._debug and logger.isEnabledFor(logging.INFO):
             extra_note = ""
             if len(suggestions) > limit:
                 extra_note = f" (requested {limit}, got {len(suggestions)} - keeping all)"
-            logger.info(f"[DEBUG] Validated {len(suggestions)} suggestions{extra_note}")
+            logger.info("[DEBUG] Validated %d suggestions%s", len(suggestions), extra_note)
             for idx, s in enumerate(suggestions, 1):
-                franchise_info = f" [{s.franchise}]" if s.franchise else ""
                 logger.info(
-                    f"[DEBUG]   {idx}. {s.title} ({s.year or 'TBA'}){franchise_info} "
-                    f"- confidence: {s.confidence:.2f}"
+                    "[DEBUG]   %d. %s (%s)%s - confidence: %.2f",
+                    idx,
+                    s.title,
+                    s.year or "TBA",
+                    f" [{s.franchise}]" if s.franchise else "",
+                    s.confidence,
                 )
 
         return suggestions
 
+    def _read_cache(self, key: str) -> tuple[float, tuple[MovieSuggestion, ...]] | None:
+        """Return ``(stored_at, suggestions)`` from disk if present and within the TTL."""
+        path = self._cache_dir / f"{key}.json"
+        try:
+            stored_at = path.stat().st_mtime
+            if time.time() - stored_at >= self._cache_ttl_hours * 3600:
+                path.unlink(missing_ok=True)
+                return None
+            return stored_at, tuple(_SUGGESTIONS_ADAPTER.validate_json(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            if self._debug:
+                logger.warning("[DEBUG] Ignoring unreadable cache entry %s: %s", path, exc)
+            return None
+
+    def _write_cache(self, key: str, suggestions: list[MovieSuggestion]) -> None:
+        """Atomically persist suggestions for ``key``; failures only disable caching."""
+        payload = orjson.dumps([s.model_dump(mode="json") for s in suggestions])
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self._cache_dir, suffix=".tmp", delete=False
+            ) as handle:
+                handle.write(payload)
+            os.replace(handle.name, self._cache_dir / f"{key}.json")
+        except OSError as exc:
+            if self._debug:
+                logger.warning("[DEBUG] Failed to write OpenAI response cache: %s", exc)
+            return
+        self._prune_cache()
+
+    def _prune_cache(self) -> None:
+        """Delete cache files older than the TTL so the directory does not grow unbounded."""
+        cutoff = time.time() - self._cache_ttl_hours * 3600
+        for path in self._cache_dir.glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue  # Removed concurrently or not ours to delete
+
     def _build_prompt(self, *, limit: int, region: str) -> str:
-        timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M UTC")
-        return (
-            "Use web_search to find movies from these sources: "
-            "(1) https://www.rottentomatoes.com/browse/movies_in_theaters - currently in theaters, "
-            "(2) https://www.rottentomatoes.com/browse/movies_at_home/sort:popular - trending streaming/home releases, "
-            "(3) https://www.imdb.com/search/title/?title_type=feature&moviemeter=,50 - IMDb most popular movies right now."
-            "Also search IMDb release calendars and movie news sites. "
-            "Include theatrical releases, blockbusters, franchise films, prestige films, AND high-quality streaming releases. "
-            "PRIORITIZE movies featuring Academy Award winners/nominees. "
-            "Return ONLY: title, release_date, overview, franchise (if applicable), confidence, and sources. "
-            f"Do NOT include any ratings or IDs - those will be fetched separately. "
-            f"{timestamp}. Find up to {limit} movies for region {region}."
-        )
+        return _build_user_prompt(int(time.time()) // 3600, limit, region)
+
+    def _raise_for_status(self, response: Any) -> None:
+        """Raise ProviderError if a Responses API result failed or was cut short."""
+        status = getattr(response, "status", None)
+        if status and status not in ("completed", "in_progress"):
+            details = getattr(response, "incomplete_details", None) or getattr(
+                response, "error", None
+            )
+            reason = f" ({details})" if details else ""
+            raise ProviderError(f"OpenAI response status={status}{reason}")
 
     def _extract_json(self, response: Any) -> dict[str, Any]:
         """Extract JSON content from a Responses API result."""
 
-        if hasattr(response, "output_text") and response.output_text:
+        self._raise_for_status(response)
+
+        if output_text := getattr(response, "output_text", None):
             try:
-                return json.loads(response.output_text)
-            except json.JSONDecodeError:
+                return orjson.loads(output_text)
+            except orjson.JSONDecodeError:
                 pass
 
         output = getattr(response, "output", None)
         if not output:
             raise ProviderError("OpenAI response did not include output content")
 
-        for item in output:
-            contents = getattr(item, "content", [])
-            for content in contents:
-                text = getattr(content, "text", None)
-                if text:
-                    candidate = text.strip()
-                    # Remove OpenAI citation markers like 【4:0†source】 or [citation]
-                    candidate = re.sub(r"【[^】]*】", "", candidate)
-                    candidate = re.sub(r"\[citation[^\]]*\]", "", candidate, flags=re.IGNORECASE)
-                    if not candidate.startswith("{"):
-                        start = candidate.find("{")
-                        end = candidate.rfind("}")
-                        if start != -1 and end != -1:
-                            candidate = candidate[start : end + 1]
-                    try:
-                        return json.loads(candidate)
-                    except json.JSONDecodeError as exc:  # pragma: no cover
-                        # Show truncated preview for debugging
-                        preview = candidate[:500] + "..." if len(candidate) > 500 else candidate
-                        raise ProviderError(
-                            f"Failed to parse OpenAI JSON payload: {exc}. Preview: {preview}",
-                        ) from exc
-
-        raise ProviderError("Unable to parse structured response from OpenAI")
+        texts = [
+            text
+            for item in output
+            # Skip web_search_call and other tool items; only messages carry text
+            if getattr(item, "type", None) in (None, "message")
+            for content in getattr(item, "content", None) or ()
+            if (text := getattr(content, "text", None))
+        ]
+        if not texts:
+            raise ProviderError("Unable to parse structured response from OpenAI")
+
+        # Join all text parts and parse the outermost object once instead of per part
+        candidate = "\n".join(texts).strip()
+        candidate = _strip_citations(candidate)
+        # Decode exactly one object from the first brace; trailing prose is ignored
+        start = max(candidate.find("{"), 0)
+        try:
+            payload, _ = _DECODER.raw_decode(candidate, start)
+        except json.JSONDecodeError as exc:
+            # Show truncated preview for debugging
+            preview = candidate[:500] + "..." if len(candidate) > 500 else candidate
+            raise ProviderError(
+                f"Failed to parse OpenAI JSON payload: {exc}. Preview: {preview}",
+            ) from exc
+        if not isinstance(payload, dict):
+            raise ProviderError(f"OpenAI JSON payload is not an object: {candidate[:500]}")
+        return payload
 
 
 __all__ = ["OpenAIProvider"]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import copy
 import logging
+import time
 
 from radarr_manager.discovery.smart.orchestrator import (
     SmartOrchestrator,
@@ -13,6 +15,14 @@ from radarr_manager.providers.base import MovieDiscoveryProvider
 
 logger = logging.getLogger(__name__)
 
+# Distinct (prompt, region, limit) results kept; the least recently used is evicted
+_CACHE_MAX_ENTRIES = 32
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Fold case and collapse whitespace so only cosmetic variants share a cache key."""
+    return " ".join(prompt.casefold().split())
+
 
 class SmartAgenticProvider(MovieDiscoveryProvider):
     """
@@ -73,6 +83,7 @@ class SmartAgenticProvider(MovieDiscoveryProvider):
         discovery_prompt: str | None = None,
         # Settings
         max_iterations: int = 5,
+        cache_ttl_seconds: float = 3600.0,
         debug: bool = False,
     ) -> None:
         """
@@ -90,10 +101,15 @@ class SmartAgenticProvider(MovieDiscoveryProvider):
             radarr_api_key: Radarr API key
             discovery_prompt: Optional custom prompt for discovery
             max_iterations: Maximum orchestrator reasoning iterations
+            cache_ttl_seconds: How long discovery results are reused (0 disables)
             debug: Enable debug logging
         """
         self._debug = debug
         self._discovery_prompt = discovery_prompt
+        self._cache_ttl = cache_ttl_seconds
+        # (normalized prompt, region, limit) -> (stored_at, suggestions) in LRU order;
+        # shared by clones
+        self._cache: dict[tuple[str, str, int], tuple[float, list[MovieSuggestion]]] = {}
 
         # Use orchestrator key for agents if not specified
         effective_agent_key = agent_api_key or orchestrator_api_key
@@ -116,11 +132,11 @@ class SmartAgenticProvider(MovieDiscoveryProvider):
 
         if self._debug:
             logger.info("[SMART-AGENTIC] Initialized with:")
-            logger.info(f"  - Orchestrator: {orchestrator_model} ({orchestrator_provider})")
-            logger.info(f"  - Agent model: {agent_model}")
-            logger.info(f"  - Scraper: {scraper_api_url}")
+            logger.info("  - Orchestrator: %s (%s)", orchestrator_model, orchestrator_provider)
+            logger.info("  - Agent model: %s", agent_model)
+            logger.info("  - Scraper: %s", scraper_api_url)
             if radarr_base_url:
-                logger.info(f"  - Radarr: {radarr_base_url} (early filtering enabled)")
+                logger.info("  - Radarr: %s (early filtering enabled)", radarr_base_url)
 
     async def discover(
         self,
@@ -157,8 +173,16 @@ class SmartAgenticProvider(MovieDiscoveryProvider):
             )
 
         if self._debug:
-            logger.info(f"[SMART-AGENTIC] Discovery prompt: {prompt}")
-            logger.info(f"[SMART-AGENTIC] Limit: {limit}, Region: {region}")
+            logger.info("[SMART-AGENTIC] Discovery prompt: %s", prompt)
+            logger.info("[SMART-AGENTIC] Limit: %d, Region: %s", limit, region)
+
+        key = (_normalize_prompt(prompt), region, limit)
+        cached = self._cache.pop(key, None)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            self._cache[key] = cached  # Re-insert as most recently used
+            if self._debug:
+                logger.info("[SMART-AGENTIC] Cache hit, skipping orchestration")
+            return list(cached[1])
 
         # Run the orchestrator
         suggestions = await self._orchestrator.discover(
@@ -166,16 +190,27 @@ class SmartAgenticProvider(MovieDiscoveryProvider):
             limit=limit,
             region=region,
         )
+        if suggestions and self._cache_ttl > 0:
+            self._store(key, suggestions)
 
-        if self._debug:
-            logger.info(f"[SMART-AGENTIC] Discovered {len(suggestions)} movies")
+        if self._debug and logger.isEnabledFor(logging.INFO):
+            logger.info("[SMART-AGENTIC] Discovered %d movies", len(suggestions))
             for idx, s in enumerate(suggestions[:5], 1):
-                logger.info(f"  {idx}. {s.title} ({s.year}) - conf: {s.confidence:.2f}")
+                logger.info("  %d. %s (%s) - conf: %.2f", idx, s.title, s.year, s.confidence)
             if len(suggestions) > 5:
-                logger.info(f"  ... and {len(suggestions) - 5} more")
+                logger.info("  ... and %d more", len(suggestions) - 5)
 
         return suggestions
 
+    def _store(self, key: tuple[str, str, int], suggestions: list[MovieSuggestion]) -> None:
+        """Cache ``suggestions``, dropping expired and least recently used entries."""
+        now = time.monotonic()
+        for stale in [k for k, (ts, _) in self._cache.items() if now - ts >= self._cache_ttl]:
+            del self._cache[stale]
+        while len(self._cache) >= _CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now, list(suggestions))
+
     def with_prompt(self, prompt: str) -> SmartAgenticProvider:
         """
         Return a new provider with a custom discovery prompt.
@@ -191,20 +226,10 @@ class SmartAgenticProvider(MovieDiscoveryProvider):
         Returns:
             New SmartAgenticProvider instance with the custom prompt
         """
-        return SmartAgenticProvider(
-            orchestrator_api_key=self._orchestrator._config.orchestrator_api_key,
-            orchestrator_model=self._orchestrator._config.orchestrator_model,
-            orchestrator_provider=self._orchestrator._config.orchestrator_provider,
-            agent_api_key=self._orchestrator._config.agent_api_key,
-            agent_model=self._orchestrator._config.agent_model,
-            scraper_api_url=self._orchestrator._config.scraper_api_url,
-            scraper_api_key=self._orchestrator._config.scraper_api_key,
-            radarr_base_url=self._orchestrator._config.radarr_base_url,
-            radarr_api_key=self._orchestrator._config.radarr_api_key,
-            discovery_prompt=prompt,
-            max_iterations=self._orchestrator._config.max_iterations,
-            debug=self._debug,
-        )
+        # The orchestrator keeps no per-run state, so the clone shares it (and its clients)
+        provider = copy.copy(self)
+        provider._discovery_prompt = prompt
+        return provider
 
 
 __all__ = ["SmartAgenticProvider"]
@@ -11,18 +11,21 @@ class StaticListProvider:
     name = "static"
 
     async def discover(self, *, limit: int, region: str | None = None) -> list[MovieSuggestion]:
+        # Trusted literals: model_construct skips validation. The date stays per call so a
+        # long-running server doesn't keep serving the day it was started.
+        today = date.today()
         suggestions = [
-            MovieSuggestion(
+            MovieSuggestion.model_construct(
                 title="Atlas Rising",
-                release_date=date.today(),
+                release_date=today,
                 overview="Prototype sci-fi thriller placeholder.",
                 franchise="Atlas",
                 confidence=0.4,
                 sources=["static"],
             ),
-            MovieSuggestion(
+            MovieSuggestion.model_construct(
                 title="Neon Heist",
-                release_date=date.today(),
+                release_date=today,
                 overview="Stylized action set-piece placeholder.",
                 confidence=0.35,
                 sources=["static"],
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedMovie:
     """A movie discovered via web scraping."""
 
@@ -28,6 +29,21 @@ class ScraperProvider(ABC):
 
     name: str = "base"
 
+    # Open ``async with`` blocks; shared scrapers are closed when the last one exits
+    _users: int = 0
+
+    async def close(self) -> None:  # noqa: B027 - optional hook, not every scraper pools
+        """Release any pooled connections held by the scraper."""
+
+    async def __aenter__(self) -> ScraperProvider:
+        self._users += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        self._users -= 1
+        if not self._users:
+            await self.close()
+
     @abstractmethod
     async def scrape_movies(self, url: str) -> list[ScrapedMovie]:
         """
@@ -44,6 +60,30 @@ class ScraperProvider(ABC):
         """
         pass
 
+    async def scrape_many(self, urls: list[str], concurrency: int = 5) -> list[ScrapedMovie]:
+        """
+        Scrape several URLs concurrently, at most ``concurrency`` at a time.
+
+        Results are concatenated in URL order; URLs that fail with ScraperError
+        are skipped.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scrape_one(url: str) -> list[ScrapedMovie]:
+            async with semaphore:
+                return await self.scrape_movies(url)
+
+        results = await asyncio.gather(*(scrape_one(url) for url in urls), return_exceptions=True)
+
+        movies: list[ScrapedMovie] = []
+        for result in results:
+            if isinstance(result, ScraperError):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            movies.extend(result)
+        return movies
+
     async def discover_all(self) -> list[ScrapedMovie]:
         """
         Scrape movies from all configured sources.
@@ -65,22 +105,27 @@ class ScraperProvider(ABC):
             ),
         ]
 
+        # Fetch all sources concurrently; dedup below stays in source order
+        results = await asyncio.gather(
+            *(self.scrape_movies(url) for url, _ in sources), return_exceptions=True
+        )
+
         all_movies: list[ScrapedMovie] = []
         seen_titles: set[str] = set()
 
-        for url, source_name in sources:
-            try:
-                movies = await self.scrape_movies(url)
-                for movie in movies:
-                    # Deduplicate by normalized title
-                    normalized = movie.title.lower().strip()
-                    if normalized not in seen_titles:
-                        seen_titles.add(normalized)
-                        movie.source = source_name
-                        all_movies.append(movie)
-            except ScraperError:
+        for (_, source_name), movies in zip(sources, results, strict=True):
+            if isinstance(movies, ScraperError):
                 # Log but continue with other sources
                 continue
+            if isinstance(movies, BaseException):
+                raise movies
+            for movie in movies:
+                # Deduplicate by normalized title
+                normalized = movie.title.strip().casefold()
+                if normalized not in seen_titles:
+                    seen_titles.add(normalized)
+                    movie.source = source_name
+                    all_movies.append(movie)
 
         return all_movies
 
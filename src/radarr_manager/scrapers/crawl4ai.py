@@ -2,15 +2,70 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import replace
+from urllib.parse import urlsplit
 
 import httpx
+import orjson
 
 from radarr_manager.scrapers.base import ScrapedMovie, ScraperError, ScraperProvider
 
 logger = logging.getLogger(__name__)
 
+# RT link formats, merged into one alternation so the page is scanned once.
+# Movie links with ratings and dates:
+#   [ XX% YY% Title Opened/Opens Month DD, YYYY ](url/m/...)
+#   [ XX% Title Opened/Opens Month DD, YYYY ](url/m/...)
+# Certified fresh picks (case-sensitive):
+#   [ XX% Title Link to Title ](url/m/...)
+# Simple watchlist format:
+#   [ XX% Title Opened/Opens Month DD, YYYY ](url) Watchlist
+_RT_LINK_RE = re.compile(
+    r"(?i:\[\s*+(?:\d++%\s*+)?(?:\d++%\s*+)?"  # Optional ratings (XX% YY%)
+    r"(?P<movie_title>[A-Z][^[\]]{2,80}?)"  # Title (starts with capital)
+    r"\s++(?:Opened?|Opens)\s++"  # Opened/Opens
+    r"[A-Z][a-z]{2}\s++\d{1,2},\s++(?P<movie_year>\d{4})"  # Month DD, YYYY
+    r"\s*+\]\s*+\(https?://www\.rottentomatoes\.com/m/)"
+    r"|\[\s*+\d++%\s++"  # Rating XX%
+    r"(?P<cert_title>[A-Z][^[\]]{2,60}?)"  # Title
+    r"\s++Link to\s+"  # "Link to"
+    r"[^[\]]++\]"  # Rest of link text
+    r"\s*+\(https?://www\.rottentomatoes\.com/m/"
+    r"|(?i:\[\s*+(?:\d++%\s*+)?"  # Optional rating
+    r"(?P<watch_title>[A-Z][^[\]]{2,60}?)"  # Title
+    r"\s++(?:Opened?|Opens)\s++"
+    r"[A-Z][a-z]{2}\s++\d{1,2},\s++(?P<watch_year>\d{4})"
+    r"\s*+\]\s*+\([^)]++\)\s*+Watchlist)"
+)
+
+# IMDB markdown headers with links
+# Format: ### [Title](https://www.imdb.com/title/ttXXXXXXX/?ref_=chtmvm_t_N)
+_IMDB_HEADER_RE = re.compile(
+    r"###\s*+\[([^\]]{2,80}+)\]"  # ### [Title]
+    r"\(https?://www\.imdb\.com/title/tt\d++/\?ref_=chtmvm_t_(\d+)\)",  # (url with rank)
+)
+
+# IMDB fallback: simple markdown links to titles
+_IMDB_LINK_RE = re.compile(r"\[([^\]]{3,80}+)\]\(https?://www\.imdb\.com/title/tt\d+")
+
+# Common "Title (Year)" pattern for unknown pages
+_GENERIC_RE = re.compile(r"([A-Z][^(\n\[\]]{2,55}?)\s*+\((\d{4})\)")
+
+# Deletion table for markdown emphasis markers (*, **, _, __)
+_MARKDOWN_FMT_TABLE = str.maketrans("", "", "*_")
+
+# Common non-title patterns in one alternation: percentages, bare numbers, UI text
+_INVALID_TITLE_RE = re.compile(
+    r"%|^\d+$|rating|score|review|trailer|watch now|stream|available",
+    re.IGNORECASE,
+)
+
 
 class Crawl4AIScraper(ScraperProvider):
     """Scraper using Crawl4AI API for reliable web scraping."""
@@ -22,33 +77,70 @@ class Crawl4AIScraper(ScraperProvider):
         *,
         api_url: str = "http://localhost:11235",
         api_key: str | None = None,
+        cache_ttl: float = 300.0,
         debug: bool = False,
     ) -> None:
         self._api_url = api_url.rstrip("/")
         self._api_key = api_key
         self._debug = debug
+        # Created on first fetch and reused so repeated scrapes share pooled connections.
+        # httpx pools are bound to the event loop that created them, so keep one per loop.
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        # url -> (monotonic fetch time, parsed movies); skips re-crawling within the TTL
+        self._cache: dict[str, tuple[float, list[ScrapedMovie]]] = {}
+        self._cache_ttl = cache_ttl
+        # Site domain -> parser; other sites use the generic parser
+        self._parsers: dict[str, Callable[[str, str], list[ScrapedMovie]]] = {
+            "rottentomatoes.com": self._parse_rt_content,
+            "imdb.com": self._parse_imdb_content,
+        }
+
+    async def close(self) -> None:
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = httpx.AsyncClient(
+                timeout=90.0,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            )
+        return client
 
     async def scrape_movies(self, url: str) -> list[ScrapedMovie]:
         """Scrape movie titles from a URL using Crawl4AI."""
+        cached = self._cache.get(url)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            if self._debug:
+                logger.info("[SCRAPER] Cache hit: %s", url)
+            # Copies, so callers relabeling results (discover_all) can't alter the cache
+            return [replace(movie) for movie in cached[1]]
+
         if self._debug:
-            logger.info(f"[SCRAPER] Fetching: {url}")
+            logger.info("[SCRAPER] Fetching: %s", url)
 
         try:
             content = await self._fetch_page(url)
         except Exception as exc:
             raise ScraperError(f"Failed to scrape {url}: {exc}") from exc
 
-        # Parse movies based on the source
-        if "rottentomatoes.com" in url:
-            movies = self._parse_rt_content(content, url)
-        elif "imdb.com" in url:
-            movies = self._parse_imdb_content(content, url)
-        else:
-            movies = self._parse_generic_content(content, url)
+        # Parse movies based on the source site (registered domain, any subdomain)
+        domain = ".".join((urlsplit(url).hostname or "").rsplit(".", 2)[-2:])
+        parser = self._parsers.get(domain, self._parse_generic_content)
+        movies = parser(content, url)
 
         if self._debug:
-            logger.info(f"[SCRAPER] Found {len(movies)} movies from {url}")
+            logger.info("[SCRAPER] Found %d movies from %s", len(movies), url)
 
+        self._cache[url] = (time.monotonic(), [replace(movie) for movie in movies])
         return movies
 
     async def _fetch_page(self, url: str) -> str:
@@ -73,20 +165,20 @@ class Crawl4AIScraper(ScraperProvider):
             },
         }
 
-        async with httpx.AsyncClient(timeout=90.0) as client:
-            response = await client.post(
-                f"{self._api_url}/crawl",
-                headers=headers,
-                json=payload,
-            )
+        response = await self._get_client().post(
+            f"{self._api_url}/crawl",
+            headers=headers,
+            content=orjson.dumps(payload),
+        )
 
-            if response.status_code != 200:
-                error_text = response.text[:500]
-                raise ScraperError(
-                    f"Crawl4AI API error {response.status_code}: {error_text}"
-                )
+        if response.status_code != 200:
+            error_text = response.text[:500]
+            raise ScraperError(
+                f"Crawl4AI API error {response.status_code}: {error_text}"
+            )
 
-            data = response.json()
+        # Responses carry whole pages of markdown; orjson parses them much faster
+        data = orjson.loads(response.content)
 
         # Extract markdown content from Crawl4AI response
         if data.get("success") and data.get("results"):
@@ -106,171 +198,100 @@ class Crawl4AIScraper(ScraperProvider):
 
     def _parse_rt_content(self, content: str, url: str) -> list[ScrapedMovie]:
         """Parse Rotten Tomatoes page content for movie titles."""
-        movies: list[ScrapedMovie] = []
-        seen_titles: set[str] = set()
-
-        # Pattern 1: Movie links with ratings and dates
-        # Format: [ XX% YY% Title Opened/Opens Month DD, YYYY ](url/m/...)
-        # or: [ XX% Title Opened/Opens Month DD, YYYY ](url/m/...)
-        movie_link_pattern = re.compile(
-            r"\[\s*(?:\d+%\s*)?(?:\d+%\s*)?"  # Optional ratings (XX% YY%)
-            r"([A-Z][^[\]]{2,80}?)"  # Title (starts with capital)
-            r"\s+(?:Opened?|Opens)\s+"  # Opened/Opens
-            r"[A-Z][a-z]{2}\s+\d{1,2},\s+(\d{4})"  # Month DD, YYYY
-            r"\s*\]\s*\(https?://www\.rottentomatoes\.com/m/",
-            re.IGNORECASE,
-        )
+        # Every RT pattern is a markdown link; HTML fallbacks have none to match
+        if "[" not in content:
+            return []
 
-        for match in movie_link_pattern.finditer(content):
-            title = match.group(1).strip()
-            year = int(match.group(2))
-            title = self._clean_title(title)
+        # Keyed by lowercased title; insertion order keeps first-seen order
+        seen: dict[str, ScrapedMovie] = {}
 
-            if self._is_valid_title(title) and title.lower() not in seen_titles:
-                seen_titles.add(title.lower())
-                movies.append(
-                    ScrapedMovie(
-                        title=title,
-                        year=year,
-                        source="rt",
-                        url=url,
-                    )
-                )
-
-        # Pattern 2: Certified fresh picks format
-        # Format: [ XX% Title Link to Title ](url/m/...)
-        cert_fresh_pattern = re.compile(
-            r"\[\s*\d+%\s+"  # Rating XX%
-            r"([A-Z][^[\]]{2,60}?)"  # Title
-            r"\s+Link to\s+"  # "Link to"
-            r"[^[\]]+\s*\]"  # Rest of link text
-            r"\s*\(https?://www\.rottentomatoes\.com/m/",
-        )
-
-        for match in cert_fresh_pattern.finditer(content):
-            title = match.group(1).strip()
+        for match in _RT_LINK_RE.finditer(content):
+            title = match["movie_title"] or match["cert_title"] or match["watch_title"]
             title = self._clean_title(title)
-
-            if self._is_valid_title(title) and title.lower() not in seen_titles:
-                seen_titles.add(title.lower())
-                movies.append(
-                    ScrapedMovie(
-                        title=title,
-                        source="rt",
-                        url=url,
-                    )
+            year_text = match["movie_year"] or match["watch_year"]
+            year = int(year_text) if year_text else None
+
+            key = title.lower()
+            if key in seen:
+                # Matches now arrive in page order, so a dated link may follow an undated one
+                if seen[key].year is None:
+                    seen[key].year = year
+            elif self._is_valid_title(title):
+                seen[key] = ScrapedMovie(
+                    title=title,
+                    year=year,
+                    source="rt",
+                    url=url,
                 )
 
-        # Pattern 3: Simple watchlist format
-        # Format: [ XX% Title Opened/Opens Month DD, YYYY ](url) Watchlist
-        watchlist_pattern = re.compile(
-            r"\[\s*(?:\d+%\s*)?"  # Optional rating
-            r"([A-Z][^[\]]{2,60}?)"  # Title
-            r"\s+(?:Opened?|Opens)\s+"
-            r"[A-Z][a-z]{2}\s+\d{1,2},\s+(\d{4})"
-            r"\s*\]\s*\([^)]+\)\s*Watchlist",
-            re.IGNORECASE,
-        )
-
-        for match in watchlist_pattern.finditer(content):
-            title = match.group(1).strip()
-            year = int(match.group(2))
-            title = self._clean_title(title)
-
-            if self._is_valid_title(title) and title.lower() not in seen_titles:
-                seen_titles.add(title.lower())
-                movies.append(
-                    ScrapedMovie(
-                        title=title,
-                        year=year,
-                        source="rt",
-                        url=url,
-                    )
-                )
-
-        return movies
+        return list(seen.values())
 
     def _parse_imdb_content(self, content: str, url: str) -> list[ScrapedMovie]:
         """Parse IMDB moviemeter page content."""
-        movies: list[ScrapedMovie] = []
-        seen_titles: set[str] = set()
+        # Both IMDB patterns need a title link, so skip the scans when there is none
+        if "imdb.com/title/tt" not in content:
+            return []
 
-        # Primary pattern: Markdown headers with IMDB links
-        # Format: ### [Title](https://www.imdb.com/title/ttXXXXXXX/?ref_=chtmvm_t_N)
-        header_pattern = re.compile(
-            r"###\s*\[([^\]]{2,80})\]"  # ### [Title]
-            r"\(https?://www\.imdb\.com/title/tt\d+/\?ref_=chtmvm_t_(\d+)\)",  # (url with rank)
-        )
+        # Keyed by lowercased title; insertion order keeps first-seen order
+        seen: dict[str, ScrapedMovie] = {}
 
-        for match in header_pattern.finditer(content):
+        # Primary pattern: Markdown headers with IMDB links
+        for match in _IMDB_HEADER_RE.finditer(content):
             title = match.group(1).strip()
             rank = int(match.group(2))
             title = self._clean_title(title)
 
             # Only take top 100 movies
-            if (
-                rank <= 100
-                and self._is_valid_title(title)
-                and title.lower() not in seen_titles
-            ):
-                seen_titles.add(title.lower())
-                movies.append(
-                    ScrapedMovie(
-                        title=title,
-                        source="imdb",
-                        url=url,
-                        extra={"rank": rank},
-                    )
+            key = title.lower()
+            if rank <= 100 and key not in seen and self._is_valid_title(title):
+                seen[key] = ScrapedMovie(
+                    title=title,
+                    source="imdb",
+                    url=url,
+                    extra={"rank": rank},
                 )
 
         # Fallback pattern: Simple markdown links to IMDB titles
-        if not movies:
-            link_pattern = re.compile(
-                r"\[([^\]]{3,80})\]\(https?://www\.imdb\.com/title/tt\d+"
-            )
-            for match in link_pattern.finditer(content):
+        if not seen:
+            for match in _IMDB_LINK_RE.finditer(content):
                 title = match.group(1).strip()
                 title = self._clean_title(title)
-                if self._is_valid_title(title) and title.lower() not in seen_titles:
-                    seen_titles.add(title.lower())
-                    movies.append(
-                        ScrapedMovie(
-                            title=title,
-                            source="imdb",
-                            url=url,
-                        )
+                key = title.lower()
+                if key not in seen and self._is_valid_title(title):
+                    seen[key] = ScrapedMovie(
+                        title=title,
+                        source="imdb",
+                        url=url,
                     )
 
-        return movies
+        return list(seen.values())
 
     def _parse_generic_content(self, content: str, url: str) -> list[ScrapedMovie]:
         """Generic parser for unknown page formats."""
-        movies: list[ScrapedMovie] = []
-        seen_titles: set[str] = set()
+        # Keyed by lowercased title; insertion order keeps first-seen order
+        seen: dict[str, ScrapedMovie] = {}
 
         # Look for common title (year) patterns
-        for match in re.finditer(r"([A-Z][^(\n\[\]]{2,55}?)\s*\((\d{4})\)", content):
+        for match in _GENERIC_RE.finditer(content):
             title = match.group(1).strip()
             year = int(match.group(2))
             title = self._clean_title(title)
 
-            if self._is_valid_title(title) and title.lower() not in seen_titles:
-                seen_titles.add(title.lower())
-                movies.append(
-                    ScrapedMovie(
-                        title=title,
-                        year=year,
-                        source="generic",
-                        url=url,
-                    )
+            key = title.lower()
+            if key not in seen and self._is_valid_title(title):
+                seen[key] = ScrapedMovie(
+                    title=title,
+                    year=year,
+                    source="generic",
+                    url=url,
                 )
 
-        return movies
+        return list(seen.values())
 
     def _clean_title(self, title: str) -> str:
         """Clean up a movie title."""
         # Remove markdown formatting
-        title = re.sub(r"\*\*|\*|__|_", "", title)
+        title = title.translate(_MARKDOWN_FMT_TABLE)
         # Remove trailing punctuation
         title = title.rstrip(".,;:-")
         # Normalize whitespace
@@ -282,28 +303,8 @@ class Crawl4AIScraper(ScraperProvider):
         if len(title) < 2 or len(title) > 80:
             return False
 
-        # Skip if it's mostly numbers or percentages
-        if "%" in title:
-            return False
-
-        # Skip common non-title patterns
-        invalid_patterns = [
-            r"^\d+$",  # Just numbers
-            r"^[A-Z]{2,}$",  # All caps abbreviations
-            r"rating",
-            r"score",
-            r"review",
-            r"trailer",
-            r"watch now",
-            r"stream",
-            r"available",
-        ]
-        title_lower = title.lower()
-        for pattern in invalid_patterns:
-            if re.search(pattern, title_lower):
-                return False
-
-        return True
+        # Skip percentages, bare numbers and common non-title patterns
+        return _INVALID_TITLE_RE.search(title) is None
 
 
 __all__ = ["Crawl4AIScraper"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from radarr_manager.scrapers.base import ScraperError, ScraperProvider
 
 
@@ -29,35 +31,44 @@ def build_scraper(
         debug: Enable debug logging
 
     Returns:
-        Configured ScraperProvider instance
+        Configured ScraperProvider instance; use it as ``async with build_scraper(...)``
+        so pooled connections are closed when done
 
     Raises:
         ScraperError: If the provider is not supported
     """
     provider = provider.lower()
 
-    if provider == "crawl4ai":
-        from radarr_manager.scrapers.crawl4ai import Crawl4AIScraper
+    try:
+        builder = _BUILDERS[provider]
+    except KeyError:
+        raise ScraperError(
+            f"Unsupported scraper provider: {provider}. "
+            f"Valid options: {', '.join(_BUILDERS)}"
+        ) from None
+
+    return builder(api_url or DEFAULT_URLS[provider], api_key, debug)
+
+
+def _build_crawl4ai(api_url: str, api_key: str | None, debug: bool) -> ScraperProvider:
+    from radarr_manager.scrapers.crawl4ai import Crawl4AIScraper
 
-        return Crawl4AIScraper(
-            api_url=api_url or DEFAULT_URLS["crawl4ai"],
-            api_key=api_key,
-            debug=debug,
-        )
+    return Crawl4AIScraper(api_url=api_url, api_key=api_key, debug=debug)
 
-    if provider == "firecrawl":
-        from radarr_manager.scrapers.firecrawl import FirecrawlScraper
 
-        return FirecrawlScraper(
-            api_url=api_url or DEFAULT_URLS["firecrawl"],
-            api_key=api_key,
-            debug=debug,
-        )
+def _build_firecrawl(api_url: str, api_key: str | None, debug: bool) -> ScraperProvider:
+    from radarr_manager.scrapers.firecrawl import FirecrawlScraper
 
-    raise ScraperError(
-        f"Unsupported scraper provider: {provider}. "
-        "Valid options: crawl4ai, firecrawl"
-    )
+    return FirecrawlScraper(api_url=api_url, api_key=api_key, debug=debug)
+
+
+_ScraperBuilder = Callable[[str, str | None, bool], ScraperProvider]
+
+# Provider name -> builder; scraper modules are imported only when chosen
+_BUILDERS: dict[str, _ScraperBuilder] = {
+    "crawl4ai": _build_crawl4ai,
+    "firecrawl": _build_firecrawl,
+}
 
 
 __all__ = ["build_scraper"]
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from typing import Any
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import replace
+from urllib.parse import urlsplit
 
 import httpx
+import orjson
 
 from radarr_manager.scrapers.base import ScrapedMovie, ScraperError, ScraperProvider
 
@@ -17,10 +23,44 @@ RT_MOVIE_PATTERN = re.compile(
     r"(?:^|\n)([A-Z][^(\n]{2,50})\s*\((\d{4})\)",
     re.MULTILINE,
 )
+# RT line starting with "Title (Year)", or else the first [Title](/m/slug) link on it
+RT_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*([A-Z][^(\[\]\n]{2,50}?)[^\S\n]*\((\d{4})\)"
+    r"|\[([^\]\n]{3,50})\]\(/m/[a-z0-9_]+\)",
+    re.MULTILINE,
+)
+# Navigation/menu text; any line containing one of these is skipped
+RT_SKIP_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in [
+            "sign in",
+            "menu",
+            "search",
+            "home",
+            "movies",
+            "tv shows",
+            "more",
+            "what to watch",
+            "rotten tomatoes",
+            "certified fresh",
+            "audience score",
+            "tomatometer",
+            "see all",
+            "view all",
+        ]
+    ),
+    re.IGNORECASE,
+)
 IMDB_MOVIE_PATTERN = re.compile(
     r"(\d+)\.\s*([^(\n]{2,60})\s*\((\d{4})\)",
     re.MULTILINE,
 )
+# Table cell "| Title (Year)", kept within a single line
+IMDB_TABLE_PATTERN = re.compile(r"\|[^\S\n]*([^|\n]{3,50}?)[^\S\n]*\((\d{4})\)")
+# Table header words; cells containing any of them are not titles
+IMDB_TABLE_SKIP_PATTERN = re.compile(r"rank|title|year|rating", re.IGNORECASE)
+GENERIC_MOVIE_PATTERN = re.compile(r"([A-Z][^(\n\[\]]{2,50}?)\s*\((\d{4})\)")
 
 
 class FirecrawlScraper(ScraperProvider):
@@ -33,33 +73,70 @@ class FirecrawlScraper(ScraperProvider):
         *,
         api_url: str = "http://localhost:3002",
         api_key: str | None = None,
+        cache_ttl: float = 300.0,
         debug: bool = False,
     ) -> None:
         self._api_url = api_url.rstrip("/")
         self._api_key = api_key
         self._debug = debug
+        # Created on first fetch and reused so repeated scrapes share pooled connections.
+        # httpx pools are bound to the event loop that created them, so keep one per loop.
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        # url -> (monotonic fetch time, parsed movies); skips re-scraping within the TTL
+        self._cache: dict[str, tuple[float, list[ScrapedMovie]]] = {}
+        self._cache_ttl = cache_ttl
+        # Site domain -> parser; other sites use the generic parser
+        self._parsers: dict[str, Callable[[str, str], list[ScrapedMovie]]] = {
+            "rottentomatoes.com": self._parse_rt_content,
+            "imdb.com": self._parse_imdb_content,
+        }
+
+    async def close(self) -> None:
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0, connect=5.0, write=10.0, pool=5.0),
+                limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0),
+            )
+        return client
 
     async def scrape_movies(self, url: str) -> list[ScrapedMovie]:
         """Scrape movie titles from a URL using Firecrawl."""
+        cached = self._cache.get(url)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            if self._debug:
+                logger.info("[SCRAPER] Cache hit: %s", url)
+            # Copies, so callers relabeling results (discover_all) can't alter the cache
+            return [replace(movie) for movie in cached[1]]
+
         if self._debug:
-            logger.info(f"[SCRAPER] Fetching: {url}")
+            logger.info("[SCRAPER] Fetching: %s", url)
 
         try:
             content = await self._fetch_page(url)
         except Exception as exc:
             raise ScraperError(f"Failed to scrape {url}: {exc}") from exc
 
-        # Parse movies based on the source
-        if "rottentomatoes.com" in url:
-            movies = self._parse_rt_content(content, url)
-        elif "imdb.com" in url:
-            movies = self._parse_imdb_content(content, url)
-        else:
-            movies = self._parse_generic_content(content, url)
+        # Parse movies based on the source site (registered domain, any subdomain)
+        domain = ".".join((urlsplit(url).hostname or "").rsplit(".", 2)[-2:])
+        parser = self._parsers.get(domain, self._parse_generic_content)
+        movies = parser(content, url)
 
         if self._debug:
-            logger.info(f"[SCRAPER] Found {len(movies)} movies from {url}")
+            logger.info("[SCRAPER] Found %d movies from %s", len(movies), url)
 
+        self._cache[url] = (time.monotonic(), [replace(movie) for movie in movies])
         return movies
 
     async def _fetch_page(self, url: str) -> str:
@@ -75,20 +152,19 @@ class FirecrawlScraper(ScraperProvider):
             "waitFor": 3000,  # Wait for JS rendering
         }
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self._api_url}/v1/scrape",
-                headers=headers,
-                json=payload,
-            )
+        response = await self._get_client().post(
+            f"{self._api_url}/v1/scrape",
+            headers=headers,
+            content=orjson.dumps(payload),
+        )
 
-            if response.status_code != 200:
-                error_text = response.text[:500]
-                raise ScraperError(
-                    f"Firecrawl API error {response.status_code}: {error_text}"
-                )
+        if response.status_code != 200:
+            error_text = response.text[:500]
+            raise ScraperError(
+                f"Firecrawl API error {response.status_code}: {error_text}"
+            )
 
-            data = response.json()
+        data = orjson.loads(response.content)
 
         # Extract markdown content from response
         if data.get("success") and data.get("data"):
@@ -104,134 +180,89 @@ class FirecrawlScraper(ScraperProvider):
 
         # RT format typically has movie cards with title and year
         # Look for patterns like "Movie Title (2024)" or markdown links
-        lines = content.split("\n")
-
-        for line in lines:
-            line = line.strip()
-            if not line or len(line) < 3:
+        # One scan over the page; only the first match on each line counts
+        line_end = -1
+        for match in RT_LINE_PATTERN.finditer(content):
+            if match.start() < line_end:
                 continue
+            line_start = content.rfind("\n", 0, match.start()) + 1
+            line_end = content.find("\n", match.end())
+            if line_end == -1:
+                line_end = len(content)
 
             # Skip navigation/menu items
-            if any(
-                skip in line.lower()
-                for skip in [
-                    "sign in",
-                    "menu",
-                    "search",
-                    "home",
-                    "movies",
-                    "tv shows",
-                    "more",
-                    "what to watch",
-                    "rotten tomatoes",
-                    "certified fresh",
-                    "audience score",
-                    "tomatometer",
-                    "see all",
-                    "view all",
-                ]
-            ):
-                continue
-
-            # Try to extract title (Year) pattern
-            match = re.search(r"^([A-Z][^(\[\]]{2,50}?)\s*\((\d{4})\)", line)
-            if match:
-                title = match.group(1).strip()
-                year = int(match.group(2))
-
-                # Skip if title is too generic or contains scores
-                if len(title) > 3 and "%" not in title:
-                    movies.append(
-                        ScrapedMovie(
-                            title=title,
-                            year=year,
-                            source="rt",
-                            url=url,
-                        )
-                    )
+            if RT_SKIP_PATTERN.search(content, line_start, line_end):
                 continue
 
-            # Try markdown link pattern [Title](url)
-            link_match = re.search(r"\[([^\]]{3,50})\]\(/m/[a-z0-9_]+\)", line)
-            if link_match:
-                title = link_match.group(1).strip()
-                if len(title) > 3 and "%" not in title:
-                    movies.append(
-                        ScrapedMovie(
-                            title=title,
-                            source="rt",
-                            url=url,
-                        )
-                    )
-
-        return movies
-
-    def _parse_imdb_content(self, content: str, url: str) -> list[ScrapedMovie]:
-        """Parse IMDB moviemeter page content."""
-        movies: list[ScrapedMovie] = []
-
-        # IMDB moviemeter format: "1. Movie Title (2024)"
-        for match in IMDB_MOVIE_PATTERN.finditer(content):
-            rank = int(match.group(1))
-            title = match.group(2).strip()
-            year = int(match.group(3))
+            title = (match.group(1) or match.group(3)).strip()
+            year = int(match.group(2)) if match.group(2) else None
 
-            # Only take top movies (reasonable limit)
-            if rank <= 50 and len(title) > 2:
+            # Skip if title is too generic or contains scores
+            if len(title) > 3 and "%" not in title:
                 movies.append(
                     ScrapedMovie(
                         title=title,
                         year=year,
-                        source="imdb",
+                        source="rt",
                         url=url,
-                        extra={"rank": rank},
                     )
                 )
 
-        # Also try markdown table format that IMDB sometimes uses
-        lines = content.split("\n")
-        for line in lines:
-            # Look for table rows with movie data
-            if "|" in line and "(" in line and ")" in line:
-                # Extract title from table cell
-                match = re.search(r"\|\s*([^|]{3,50}?)\s*\((\d{4})\)", line)
-                if match:
-                    title = match.group(1).strip()
-                    year = int(match.group(2))
-                    if len(title) > 2 and not any(
-                        skip in title.lower()
-                        for skip in ["rank", "title", "year", "rating"]
-                    ):
-                        movies.append(
-                            ScrapedMovie(
-                                title=title,
-                                year=year,
-                                source="imdb",
-                                url=url,
-                            )
-                        )
-
         return movies
 
-    def _parse_generic_content(self, content: str, url: str) -> list[ScrapedMovie]:
-        """Generic parser for unknown page formats."""
-        movies: list[ScrapedMovie] = []
+    def _parse_imdb_content(self, content: str, url: str) -> list[ScrapedMovie]:
+        """Parse IMDB moviemeter page content."""
+        # IMDB moviemeter format: "1. Movie Title (2024)"
+        # Only take top movies (reasonable limit)
+        movies = [
+            ScrapedMovie(
+                title=title,
+                year=int(match.group(3)),
+                source="imdb",
+                url=url,
+                extra={"rank": rank},
+            )
+            for match in IMDB_MOVIE_PATTERN.finditer(content)
+            if (rank := int(match.group(1))) <= 50 and len(title := match.group(2).strip()) > 2
+        ]
+
+        # Also try markdown table format that IMDB sometimes uses
+        # One scan over the page; only the first table cell on each row counts
+        line_end = -1
+        for match in IMDB_TABLE_PATTERN.finditer(content):
+            if match.start() < line_end:
+                continue
+            line_end = content.find("\n", match.end())
+            if line_end == -1:
+                line_end = len(content)
 
-        # Look for common title (year) patterns
-        for match in re.finditer(r"([A-Z][^(\n\[\]]{2,50}?)\s*\((\d{4})\)", content):
             title = match.group(1).strip()
             year = int(match.group(2))
-            if len(title) > 3:
+            if len(title) > 2 and not IMDB_TABLE_SKIP_PATTERN.search(title):
                 movies.append(
                     ScrapedMovie(
                         title=title,
                         year=year,
-                        source="generic",
+                        source="imdb",
                         url=url,
                     )
                 )
 
         return movies
 
+    def _parse_generic_content(self, content: str, url: str) -> list[ScrapedMovie]:
+        """Generic parser for unknown page formats."""
+        # Look for common title (year) patterns
+        return [
+            ScrapedMovie(
+                title=title,
+                year=int(match.group(2)),
+                source="generic",
+                url=url,
+            )
+            for match in GENERIC_MOVIE_PATTERN.finditer(content)
+            if len(title := match.group(1).strip()) > 3
+        ]
+
 
 __all__ = ["FirecrawlScraper"]
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from radarr_manager.models import MovieSuggestion
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MovieAnalysis:
     """Comprehensive analysis result for a single movie."""
 
@@ -24,83 +27,119 @@ class MovieAnalysis:
     should_add: bool
 
 
+class _Ratings(NamedTuple):
+    """Rating fields read once from a movie's metadata."""
+
+    imdb_rating: float | None
+    imdb_votes: int
+    rt_critics: float | None
+    rt_audience: float | None
+    metacritic: float | None
+
+    @classmethod
+    def from_metadata(cls, metadata: dict[str, Any]) -> _Ratings:
+        return cls(
+            metadata.get("imdb_rating"),
+            metadata.get("imdb_votes") or 0,  # Handle None explicitly
+            metadata.get("rt_critics_score"),
+            metadata.get("rt_audience_score"),
+            metadata.get("metacritic_score"),
+        )
+
+
 # Regional cinema languages that require higher quality threshold (8.0+ IMDb)
 # These are non-English regional films that typically have limited global distribution
-REGIONAL_CINEMA_LANGUAGES = {
-    "bengali",
-    "hindi",
-    "tamil",
-    "telugu",
-    "kannada",
-    "malayalam",
-    "marathi",
-    "punjabi",
-    "gujarati",
-    "odia",
-    "assamese",
-    "yoruba",      # Nollywood
-    "hausa",       # Nollywood
-    "igbo",        # Nollywood
-    "thai",
-    "indonesian",
-    "vietnamese",
-    "tagalog",     # Filipino
-    "cebuano",     # Filipino
-}
+REGIONAL_CINEMA_LANGUAGES = frozenset(
+    {
+        "bengali",
+        "hindi",
+        "tamil",
+        "telugu",
+        "kannada",
+        "malayalam",
+        "marathi",
+        "punjabi",
+        "gujarati",
+        "odia",
+        "assamese",
+        "yoruba",      # Nollywood
+        "hausa",       # Nollywood
+        "igbo",        # Nollywood
+        "thai",
+        "indonesian",
+        "vietnamese",
+        "tagalog",     # Filipino
+        "cebuano",     # Filipino
+    }
+)
 
 # Minimum IMDb rating required for regional cinema to be considered
 REGIONAL_CINEMA_MIN_IMDB = 8.0
 
-MAJOR_FRANCHISES = {
-    "marvel",
-    "mcu",
-    "marvel cinematic universe",
-    "dc",
-    "dceu",
-    "dc extended universe",
-    "dc universe",
-    "disney",
-    "pixar",
-    "star wars",
-    "harry potter",
-    "wizarding world",
-    "fast & furious",
-    "fast and furious",
-    "jurassic",
-    "jurassic world",
-    "jurassic park",
-    "transformers",
-    "mission impossible",
-    "james bond",
-    "007",
-    "avatar",
-    "lord of the rings",
-    "hobbit",
-    "batman",
-    "superman",
-    "spider-man",
-    "spiderman",
-    "x-men",
-    "avengers",
-    "guardians of the galaxy",
-    "toy story",
-    "incredibles",
-    "minions",
-    "despicable me",
-    "shrek",
-    "kung fu panda",
-    "how to train your dragon",
-    "frozen",
-    "moana",
-    "john wick",
-    "planet of the apes",
-    "godzilla",
-    "monsterverse",
-    "conjuring",
-    "knives out",
-    "paddington",
-    "spongebob",
-}
+MAJOR_FRANCHISES = frozenset(
+    {
+        "marvel",
+        "mcu",
+        "marvel cinematic universe",
+        "dc",
+        "dceu",
+        "dc extended universe",
+        "dc universe",
+        "disney",
+        "pixar",
+        "star wars",
+        "harry potter",
+        "wizarding world",
+        "fast & furious",
+        "fast and furious",
+        "jurassic",
+        "jurassic world",
+        "jurassic park",
+        "transformers",
+        "mission impossible",
+        "james bond",
+        "007",
+        "avatar",
+        "lord of the rings",
+        "hobbit",
+        "batman",
+        "superman",
+        "spider-man",
+        "spiderman",
+        "x-men",
+        "avengers",
+        "guardians of the galaxy",
+        "toy story",
+        "incredibles",
+        "minions",
+        "despicable me",
+        "shrek",
+        "kung fu panda",
+        "how to train your dragon",
+        "frozen",
+        "moana",
+        "john wick",
+        "planet of the apes",
+        "godzilla",
+        "monsterverse",
+        "conjuring",
+        "knives out",
+        "paddington",
+        "spongebob",
+    }
+)
+
+# Any major franchise keyword as a substring, matched in a single scan
+_MAJOR_FRANCHISE_RE = re.compile(
+    "|".join(re.escape(name) for name in sorted(MAJOR_FRANCHISES, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_major_franchise_name(franchise: str) -> bool:
+    # Franchise names repeat across a batch (every MCU entry), so memoize by string
+    return _MAJOR_FRANCHISE_RE.search(franchise) is not None
 
 
 class DeepAnalysisService:
@@ -113,9 +152,8 @@ class DeepAnalysisService:
         """Check if movie belongs to a major franchise."""
         if not movie.franchise:
             return False
-        franchise_lower = movie.franchise.lower()
         # Check if franchise name matches or contains a major franchise keyword
-        return any(major in franchise_lower for major in MAJOR_FRANCHISES)
+        return _is_major_franchise_name(movie.franchise)
 
     def _is_regional_cinema(self, metadata: dict[str, Any]) -> tuple[bool, str | None]:
         """
@@ -147,32 +185,32 @@ class DeepAnalysisService:
         metadata = movie.metadata or {}
 
         # Extract ratings
-        imdb_rating = metadata.get("imdb_rating")
-        imdb_votes = metadata.get("imdb_votes", 0)
-        rt_critics = metadata.get("rt_critics_score")
-        rt_audience = metadata.get("rt_audience_score")
-        metacritic = metadata.get("metacritic_score")
-
-        if self._debug:
-            logger.info(f"[DEEP ANALYSIS] Analyzing: {movie.title}")
+        ratings = _Ratings.from_metadata(metadata)
+        imdb_rating, imdb_votes, rt_critics, rt_audience, metacritic = ratings
+
+        if self._debug and logger.isEnabledFor(logging.INFO):
+            logger.info("[DEEP ANALYSIS] Analyzing: %s", movie.title)
             imdb_str = f"{imdb_rating}/10" if imdb_rating is not None else "N/A"
             imdb_votes_str = f"{imdb_votes:,}" if imdb_votes else "0"
             rt_critics_str = f"{rt_critics}%" if rt_critics is not None else "N/A"
             rt_audience_str = f"{rt_audience}%" if rt_audience is not None else "N/A"
             metacritic_str = str(metacritic) if metacritic is not None else "N/A"
             logger.info(
-                f"  IMDb: {imdb_str} ({imdb_votes_str} votes), "
-                f"RT: {rt_critics_str} critics / {rt_audience_str} audience, "
-                f"Metacritic: {metacritic_str}"
+                "  IMDb: %s (%s votes), RT: %s critics / %s audience, Metacritic: %s",
+                imdb_str,
+                imdb_votes_str,
+                rt_critics_str,
+                rt_audience_str,
+                metacritic_str,
             )
 
         is_major_franchise = self._is_major_franchise(movie)
-        red_flags = self._detect_red_flags(movie, metadata, is_major_franchise)
-        strengths = self._identify_strengths(movie, metadata, is_major_franchise)
+        red_flags = self._detect_red_flags(movie, ratings, is_major_franchise)
+        strengths = self._identify_strengths(movie, ratings, is_major_franchise)
         quality_score = self._calculate_quality_score(
-            metadata, red_flags, strengths, is_major_franchise, movie.confidence
+            ratings, red_flags, strengths, is_major_franchise, movie.confidence
         )
-        rating_details = self._build_rating_details(metadata)
+        rating_details = self._build_rating_details(ratings, metadata)
 
         # Determine recommendation
         recommendation = self._generate_recommendation(movie, quality_score, red_flags, strengths)
@@ -190,7 +228,6 @@ class DeepAnalysisService:
         # Reject regional cinema unless it has exceptional ratings (8.0+ IMDb)
         is_regional, regional_lang = self._is_regional_cinema(metadata)
         if is_regional and should_add:
-            imdb_rating = metadata.get("imdb_rating")
             if imdb_rating is None or imdb_rating < REGIONAL_CINEMA_MIN_IMDB:
                 should_add = False
                 rating_str = f"{imdb_rating}/10" if imdb_rating else "N/A"
@@ -198,11 +235,11 @@ class DeepAnalysisService:
                     f"Regional cinema ({regional_lang}) - requires {REGIONAL_CINEMA_MIN_IMDB}+ IMDb, has {rating_str}"
                 )
 
-        if self._debug:
-            logger.info(f"  Quality Score: {quality_score:.1f}/10")
-            logger.info(f"  Recommendation: {recommendation}")
-            logger.info(f"  Red Flags: {len(red_flags)}")
-            logger.info(f"  Decision: {'✓ ADD' if should_add else '✗ SKIP'}")
+        if self._debug and logger.isEnabledFor(logging.INFO):
+            logger.info("  Quality Score: %.1f/10", quality_score)
+            logger.info("  Recommendation: %s", recommendation)
+            logger.info("  Red Flags: %d", len(red_flags))
+            logger.info("  Decision: %s", "✓ ADD" if should_add else "✗ SKIP")
 
         return MovieAnalysis(
             movie=movie,
@@ -214,17 +251,25 @@ class DeepAnalysisService:
             should_add=should_add,
         )
 
+    async def analyze_movies(
+        self, movies: list[MovieSuggestion], *, max_concurrency: int = 16
+    ) -> list[MovieAnalysis]:
+        """Analyze a batch of movies concurrently, returning results in input order."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_one(movie: MovieSuggestion) -> MovieAnalysis:
+            async with semaphore:
+                return await self.analyze_movie(movie)
+
+        return list(await asyncio.gather(*(analyze_one(movie) for movie in movies)))
+
     def _detect_red_flags(
-        self, movie: MovieSuggestion, metadata: dict[str, Any], is_major_franchise: bool
+        self, movie: MovieSuggestion, ratings: _Ratings, is_major_franchise: bool
     ) -> list[str]:
         """Detect quality red flags that might indicate a poor movie."""
         flags = []
 
-        imdb_rating = metadata.get("imdb_rating")
-        imdb_votes = metadata.get("imdb_votes") or 0  # Handle None explicitly
-        rt_critics = metadata.get("rt_critics_score")
-        rt_audience = metadata.get("rt_audience_score")
-        metacritic = metadata.get("metacritic_score")
+        imdb_rating, imdb_votes, rt_critics, rt_audience, metacritic = ratings
 
         # Low vote count = unreliable rating
         if imdb_votes and imdb_votes < 1000:
@@ -258,7 +303,7 @@ class DeepAnalysisService:
                 flags.append(f"Large RT critic/audience gap ({gap} points) - divisive reception")
 
         # No ratings available at all
-        if not any([imdb_rating, rt_critics, rt_audience, metacritic]):
+        if not (imdb_rating or rt_critics or rt_audience or metacritic):
             flags.append("No ratings available - unreleased or unreviewed")
 
         # Critics-only with no audience data - unreliable for general appeal
@@ -268,16 +313,12 @@ class DeepAnalysisService:
         return flags
 
     def _identify_strengths(
-        self, movie: MovieSuggestion, metadata: dict[str, Any], is_major_franchise: bool
+        self, movie: MovieSuggestion, ratings: _Ratings, is_major_franchise: bool
     ) -> list[str]:
         """Identify quality strengths that indicate a good movie."""
         strengths = []
 
-        imdb_rating = metadata.get("imdb_rating")
-        imdb_votes = metadata.get("imdb_votes") or 0  # Handle None explicitly
-        rt_critics = metadata.get("rt_critics_score")
-        rt_audience = metadata.get("rt_audience_score")
-        metacritic = metadata.get("metacritic_score")
+        imdb_rating, imdb_votes, rt_critics, rt_audience, metacritic = ratings
 
         # High confidence rating
         if imdb_votes and imdb_votes > 50000:
@@ -322,7 +363,7 @@ class DeepAnalysisService:
 
     def _calculate_quality_score(
         self,
-        metadata: dict[str, Any],
+        ratings: _Ratings,
         red_flags: list[str],
         strengths: list[str],
         is_major_franchise: bool,
@@ -334,13 +375,18 @@ class DeepAnalysisService:
         Weighs RT scores more heavily than IMDb as requested by user.
         Major franchises get a baseline boost to account for critic/audience splits.
         """
-        scores = []
+        imdb_rating, imdb_votes, rt_critics, rt_audience, metacritic = ratings
+
+        # No ratings available - use discovery confidence as primary signal
+        if (
+            imdb_rating is None
+            and rt_critics is None
+            and rt_audience is None
+            and metacritic is None
+        ):
+            return self._confidence_fallback_score(confidence, is_major_franchise)
 
-        imdb_rating = metadata.get("imdb_rating")
-        imdb_votes = metadata.get("imdb_votes") or 0  # Handle None explicitly
-        rt_critics = metadata.get("rt_critics_score")
-        rt_audience = metadata.get("rt_audience_score")
-        metacritic = metadata.get("metacritic_score")
+        scores = []
 
         # RT Critics Score (highest weight: 35%)
         if rt_critics is not None:
@@ -364,22 +410,6 @@ class DeepAnalysisService:
                 weight *= 0.75
             scores.append(("imdb", imdb_rating, weight))
 
-        if not scores:
-            # No ratings available - use discovery confidence as primary signal
-            # This helps identify unreleased major films vs obscure unknowns
-            if confidence >= 0.85:
-                base_score = 6.5  # High confidence = likely quality release
-            elif confidence >= 0.80:
-                base_score = 6.0  # Good confidence = benefit of doubt
-            elif confidence >= 0.70:
-                base_score = 5.5  # Moderate confidence = borderline
-            else:
-                base_score = 5.0  # Low confidence = skip
-            # Major franchises get additional boost
-            if is_major_franchise:
-                base_score = min(10, base_score + 0.5)
-            return base_score
-
         # Normalize weights to sum to 1.0
         total_weight = sum(weight for _, _, weight in scores)
         normalized_scores = [(name, score, weight / total_weight) for name, score, weight in scores]
@@ -428,14 +458,34 @@ class DeepAnalysisService:
 
         return round(quality_score, 1)
 
-    def _build_rating_details(self, metadata: dict[str, Any]) -> dict[str, Any]:
+    def _confidence_fallback_score(self, confidence: float, is_major_franchise: bool) -> float:
+        """
+        Score a movie with no ratings from its discovery confidence.
+
+        This helps identify unreleased major films vs obscure unknowns.
+        """
+        if confidence >= 0.85:
+            base_score = 6.5  # High confidence = likely quality release
+        elif confidence >= 0.80:
+            base_score = 6.0  # Good confidence = benefit of doubt
+        elif confidence >= 0.70:
+            base_score = 5.5  # Moderate confidence = borderline
+        else:
+            base_score = 5.0  # Low confidence = skip
+        # Major franchises get additional boost
+        if is_major_franchise:
+            base_score = min(10, base_score + 0.5)
+        return base_score
+
+    def _build_rating_details(self, ratings: _Ratings, metadata: dict[str, Any]) -> dict[str, Any]:
         """Build detailed rating breakdown for display."""
         return {
-            "imdb_rating": metadata.get("imdb_rating"),
+            "imdb_rating": ratings.imdb_rating,
+            # Raw value: display and MCP output distinguish a missing count from 0
             "imdb_votes": metadata.get("imdb_votes"),
-            "rt_critics_score": metadata.get("rt_critics_score"),
-            "rt_audience_score": metadata.get("rt_audience_score"),
-            "metacritic_score": metadata.get("metacritic_score"),
+            "rt_critics_score": ratings.rt_critics,
+            "rt_audience_score": ratings.rt_audience,
+            "metacritic_score": ratings.metacritic,
         }
 
     def _generate_recommendation(
@@ -0,0 +1,10 @@
+import pytest
+
+from radarr_manager.providers import openai as openai_provider
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep provider response caches out of the real home directory between tests."""
+    monkeypatch.setenv("RADARR_CACHE_DIR", str(tmp_path / "cache"))
+    openai_provider._RESPONSE_CACHE.clear()
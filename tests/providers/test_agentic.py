@@ -0,0 +1,71 @@
+"""Tests for the agentic discovery provider."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from radarr_manager.discovery.parsers import ParsedMovie
+from radarr_manager.models import MovieSuggestion
+from radarr_manager.providers.agentic import AgenticProvider
+
+
+class TestAgenticDeadline:
+    """Test deadline-bounded discovery."""
+
+    @pytest.mark.asyncio
+    async def test_deadline_returns_partial_results(self):
+        """Test an expired deadline returns the orchestrator's partial snapshot."""
+
+        async def never_finishes(**kwargs):
+            await asyncio.Event().wait()
+
+        provider = AgenticProvider()
+        orchestrator = MagicMock()
+        orchestrator.discover.side_effect = never_finishes
+        orchestrator.partial_movies.return_value = [MovieSuggestion(title="Early Bird")]
+        provider._orchestrator = orchestrator
+
+        result = await provider.discover(limit=3, deadline_seconds=0.01)
+
+        assert [s.title for s in result] == ["Early Bird"]
+        partial = orchestrator.discover.call_args.kwargs["partial"]
+        orchestrator.partial_movies.assert_called_once_with(partial, 3)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_keep_separate_partial_results(self):
+        """Test a timed-out run returns only the movies its own run fetched."""
+
+        async def fetch_then_hang(*, prompt, limit, region, partial):
+            partial.append(ParsedMovie(title=f"{region} Movie", source="scrape"))
+            await asyncio.Event().wait()
+
+        provider = AgenticProvider()
+        provider._orchestrator.discover = fetch_then_hang
+
+        us, uk = await asyncio.gather(
+            provider.discover(limit=3, region="US", deadline_seconds=0.01),
+            provider.discover(limit=3, region="UK", deadline_seconds=0.01),
+        )
+
+        assert [s.title for s in us] == ["US Movie"]
+        assert [s.title for s in uk] == ["UK Movie"]
+
+
+class TestAgenticScraper:
+    """Test the lifetime of the scraper's connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_scraper_is_closed_after_discovery(self):
+        """Test the scraper is released even when discovery fails."""
+        scraper = AsyncMock()
+        provider = AgenticProvider(scraper=scraper)
+        orchestrator = MagicMock()
+        orchestrator.discover = AsyncMock(side_effect=RuntimeError("boom"))
+        provider._orchestrator = orchestrator
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await provider.discover(limit=3)
+
+        scraper.__aenter__.assert_awaited_once()
+        scraper.__aexit__.assert_awaited_once()
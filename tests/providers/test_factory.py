@@ -23,3 +23,15 @@ def test_openai_provider_requires_api_key() -> None:
     settings = Settings(llm_provider="openai")
     with pytest.raises(ProviderError):
         build_provider(settings)
+
+
+def test_factory_rejects_unknown_discovery_mode() -> None:
+    settings = Settings()
+    with pytest.raises(ProviderError, match="Valid modes: agentic, hybrid, openai"):
+        build_provider(settings, override="bogus")
+
+
+def test_factory_accepts_smart_alias() -> None:
+    settings = Settings(openai_api_key="fake-key")
+    provider = build_provider(settings, override="SMART")
+    assert provider.name == "smart_agentic"
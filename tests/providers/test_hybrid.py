@@ -0,0 +1,78 @@
+"""Tests for the hybrid scraper + OpenAI discovery provider."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from radarr_manager.models import MovieSuggestion
+from radarr_manager.providers.base import ProviderError
+from radarr_manager.providers.hybrid import HybridDiscoveryProvider
+from radarr_manager.scrapers.base import ScrapedMovie
+
+
+@pytest.fixture
+def mock_scraper():
+    """Create a scraper whose discover_all returns two movies."""
+    scraper = AsyncMock()
+    scraper.discover_all.return_value = [
+        ScrapedMovie(title="Sinners!", source="rt_theaters", year=2025),
+        ScrapedMovie(title="Scraped Only", source="imdb_moviemeter"),
+    ]
+    return scraper
+
+
+class TestHybridDiscover:
+    """Test hybrid discovery flow."""
+
+    @pytest.mark.asyncio
+    async def test_openai_results_take_precedence(self, mock_scraper):
+        """Test OpenAI suggestions win on title collisions and scraper extras are kept."""
+        openai = AsyncMock()
+        openai.discover.return_value = [
+            MovieSuggestion(title="Sinners", overview="Twin brothers return home.", confidence=0.95)
+        ]
+        provider = HybridDiscoveryProvider(scraper=mock_scraper, openai_provider=openai)
+
+        result = await provider.discover(limit=5)
+
+        assert [s.title for s in result] == ["Sinners", "Scraped Only"]
+        assert result[0].overview == "Twin brothers return home."
+        assert result[1].sources == ["scraper-exclusive", "scraper:imdb_moviemeter"]
+        mock_scraper.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_scraper_and_openai_run_concurrently(self, mock_scraper):
+        """Test the scrape and the OpenAI call overlap instead of running back to back."""
+        scrape_started = asyncio.Event()
+
+        async def slow_scrape():
+            scrape_started.set()
+            await asyncio.sleep(0)
+            return []
+
+        async def openai_discover(**kwargs):
+            await asyncio.wait_for(scrape_started.wait(), timeout=1)
+            return [MovieSuggestion(title="Concurrent")]
+
+        mock_scraper.discover_all.side_effect = slow_scrape
+        openai = AsyncMock()
+        openai.discover.side_effect = openai_discover
+        provider = HybridDiscoveryProvider(scraper=mock_scraper, openai_provider=openai)
+
+        result = await provider.discover(limit=1)
+
+        assert [s.title for s in result] == ["Concurrent"]
+
+    @pytest.mark.asyncio
+    async def test_openai_failure_falls_back_to_scraped(self, mock_scraper):
+        """Test a ProviderError from OpenAI leaves the scraped results intact."""
+        openai = AsyncMock()
+        openai.discover.side_effect = ProviderError("boom")
+        provider = HybridDiscoveryProvider(scraper=mock_scraper, openai_provider=openai)
+
+        result = await provider.discover(limit=5)
+
+        assert [s.title for s in result] == ["Sinners!", "Scraped Only"]
+        assert result[0].year == 2025
+        assert result[0].metadata == {}
@@ -1,11 +1,22 @@
 """Tests for OpenAI provider functionality."""
 
+import asyncio
+import os
+import time
 import pytest
 import json
 from unittest.mock import AsyncMock, patch
-from datetime import datetime
-
-from radarr_manager.providers.openai import OpenAIProvider
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from radarr_manager.providers import openai as openai_provider_module
+from radarr_manager.providers.openai import (
+    SYSTEM_PROMPT,
+    USER_PROMPT_PREFIX,
+    OpenAIProvider,
+    _SuggestionStreamParser,
+    _validate_suggestions,
+)
 from radarr_manager.providers.base import ProviderError
 from radarr_manager.models import MovieSuggestion
 from tests.fixtures.openai_responses import (
@@ -14,6 +25,7 @@ from tests.fixtures.openai_responses import (
     MALFORMED_JSON_RESPONSE,
     RESPONSE_WITH_INVALID_DATES,
     RESPONSE_WITH_MISSING_FIELDS,
+    MockOpenAIContent,
     MockOpenAIResponse,
     VALID_JSON_RESPONSE_TEXT,
     JSON_WITH_MARKDOWN_WRAPPER,
@@ -93,6 +105,18 @@ class TestOpenAIProviderInitialization:
 
         assert provider._client == mock_openai_client
 
+    @pytest.mark.asyncio
+    async def test_providers_share_pooled_client(self):
+        """Test providers with the same key reuse one client on the running loop."""
+        first = OpenAIProvider(api_key="shared-key", model=None, region=None, cache_ttl_hours=6)
+        second = OpenAIProvider(
+            api_key="shared-key", model="gpt-4o", region="EU", cache_ttl_hours=1
+        )
+        other = OpenAIProvider(api_key="other-key", model=None, region=None, cache_ttl_hours=6)
+
+        assert first._get_client() is second._get_client()
+        assert first._get_client() is not other._get_client()
+
 
 class TestOpenAIProviderDiscover:
     """Test OpenAI provider discover functionality."""
@@ -120,6 +144,8 @@ class TestOpenAIProviderDiscover:
         assert call_args.kwargs["model"] == "gpt-4o-mini"
         assert call_args.kwargs["temperature"] == 0.3
         assert call_args.kwargs["tools"] == [{"type": "web_search"}]
+        assert call_args.kwargs["text"]["format"]["type"] == "json_schema"
+        assert call_args.kwargs["text"]["format"]["strict"] is True
 
         # Check system prompt
         input_messages = call_args.kwargs["input"]
@@ -215,6 +241,29 @@ class TestOpenAIProviderDiscover:
         assert suggestions[0].title == "Movie 0"
         assert suggestions[2].title == "Movie 2"
 
+    @pytest.mark.asyncio
+    async def test_discover_drops_duplicate_titles(self, openai_provider, mock_openai_client):
+        """Test case-insensitive duplicates collapse while keeping model order."""
+        payload = {
+            "suggestions": [
+                {"title": "Weapons", "release_date": "2025-08-08"},
+                {"title": "Nobody 2"},
+                {"title": "WEAPONS", "release_date": "2025-08-08"},
+                {"title": "Weapons", "release_date": "1999-01-01"},
+            ]
+        }
+        mock_openai_client.responses.create.return_value = MockOpenAIResponse(
+            output_text=json.dumps(payload)
+        )
+
+        suggestions = await openai_provider.discover(limit=4)
+
+        assert [(s.title, s.year) for s in suggestions] == [
+            ("Weapons", 2025),
+            ("Nobody 2", None),
+            ("Weapons", 1999),
+        ]
+
     @pytest.mark.asyncio
     async def test_discover_openai_api_error(self, openai_provider, mock_openai_client):
         """Test discovery handles OpenAI API errors."""
@@ -248,14 +297,77 @@ class TestOpenAIProviderDiscover:
         mock_response = MockOpenAIResponse(output_text=json.dumps(EMPTY_SUGGESTIONS_RESPONSE))
         mock_openai_client.responses.create.return_value = mock_response
 
-        with patch("radarr_manager.providers.openai.datetime") as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = "2024-09-19 16:30 UTC"
-
+        now = datetime(2024, 9, 19, 16, 30, tzinfo=UTC).timestamp()
+        with patch("radarr_manager.providers.openai.time.time", return_value=now):
             await openai_provider.discover(limit=1)
 
             call_args = mock_openai_client.responses.create.call_args
             user_prompt = call_args.kwargs["input"][1]["content"][0]["text"]
-            assert "2024-09-19 16:30 UTC" in user_prompt
+            # Timestamps are rounded down to the hour to keep the prompt cacheable
+            assert "2024-09-19 16:00 UTC" in user_prompt
+
+    @pytest.mark.asyncio
+    async def test_discover_skips_non_object_entries_in_debug(self, mock_openai_client):
+        """Test malformed entries are dropped in debug mode instead of crashing."""
+        provider = OpenAIProvider(
+            api_key="test-key",
+            model="gpt-4o-mini",
+            region="US",
+            cache_ttl_hours=0,
+            client=mock_openai_client,
+            debug=True,
+        )
+        payload = {"suggestions": ["not an object", {"overview": "no title"}, {"title": "Kept"}]}
+        mock_openai_client.responses.create.return_value = MockOpenAIResponse(
+            output_text=json.dumps(payload)
+        )
+
+        suggestions = await provider.discover(limit=3)
+
+        assert [s.title for s in suggestions] == ["Kept"]
+
+    @pytest.mark.asyncio
+    async def test_discover_rejects_non_object_entries(self, openai_provider, mock_openai_client):
+        """Test a non-object entry is reported as an invalid payload outside debug mode."""
+        payload = {"suggestions": [{"title": "Fine"}, 42]}
+        mock_openai_client.responses.create.return_value = MockOpenAIResponse(
+            output_text=json.dumps(payload)
+        )
+
+        with pytest.raises(ProviderError, match="expected an object, got int"):
+            await openai_provider.discover(limit=2)
+
+    @pytest.mark.asyncio
+    async def test_small_payload_validated_inline(self, openai_provider, mock_openai_client):
+        """Test small payloads skip the worker-thread hop."""
+        mock_response = MockOpenAIResponse(output_text=json.dumps(VALID_JSON_RESPONSE))
+        mock_openai_client.responses.create.return_value = mock_response
+
+        with patch("radarr_manager.providers.openai.asyncio.to_thread") as to_thread:
+            suggestions = await openai_provider.discover(limit=2, region="US")
+
+        to_thread.assert_not_called()
+        assert len(suggestions) == 2
+
+
+class TestValidateSuggestions:
+    """Test batch validation with per-item error mapping."""
+
+    def test_errors_are_mapped_back_to_their_items(self):
+        """Test invalid entries are reported by title and valid ones are kept."""
+        suggestions, errors = _validate_suggestions(
+            [
+                {"title": "Bad", "release_date": "soon", "confidence": 3},
+                {"title": "Good"},
+                {"title": "Worse", "sources": [1]},
+            ]
+        )
+
+        assert [s.title for s in suggestions] == ["Good"]
+        assert len(errors) == 2
+        assert errors[0].startswith("Bad: release_date: ")
+        assert "; confidence: " in errors[0]
+        assert errors[1].startswith("Worse: sources.0: ")
 
 
 class TestOpenAIJSONExtraction:
@@ -296,6 +408,54 @@ class TestOpenAIJSONExtraction:
 
         assert result["suggestions"][0]["title"] == "Extracted Movie"
 
+    def test_extract_json_joins_split_content_parts(self, openai_provider):
+        """Test a JSON object split across several content parts is parsed once."""
+        response = MockOpenAIResponse(output_content="Here you go:")
+        response.output[0].content.append(MockOpenAIContent('{"suggestions": [{"title": '))
+        response.output[0].content.append(MockOpenAIContent('"Split Movie"}]} Enjoy!'))
+
+        result = openai_provider._extract_json(response)
+
+        assert result["suggestions"][0]["title"] == "Split Movie"
+
+    def test_extract_json_ignores_braces_in_trailing_text(self, openai_provider):
+        """Test commentary containing braces after the object does not break parsing."""
+        response = MockOpenAIResponse(
+            output_content='{"suggestions": [{"title": "First"}]} Note: see {sources} above.'
+        )
+
+        result = openai_provider._extract_json(response)
+
+        assert result["suggestions"][0]["title"] == "First"
+
+    def test_extract_json_rejects_failed_status(self, openai_provider):
+        """Test a non-completed response fails fast without scanning output."""
+        response = MockOpenAIResponse(output_content=VALID_JSON_RESPONSE_TEXT)
+        response.status = "incomplete"
+
+        with pytest.raises(ProviderError, match="status=incomplete"):
+            openai_provider._extract_json(response)
+
+    def test_extract_json_skips_tool_call_items(self, openai_provider):
+        """Test web_search_call items are ignored when collecting message text."""
+        response = MockOpenAIResponse(output_content=VALID_JSON_RESPONSE_TEXT)
+        tool_item = SimpleNamespace(type="web_search_call", content=[MockOpenAIContent("{bad")])
+        response.output.insert(0, tool_item)
+
+        result = openai_provider._extract_json(response)
+
+        assert result["suggestions"][0]["title"] == "Test Movie"
+
+    def test_extract_json_strips_citation_markers(self, openai_provider):
+        """Test OpenAI citation markers are removed before parsing."""
+        response = MockOpenAIResponse(
+            output_content='{"suggestions": [{"title": "Cited"}]}【4:0†source】 [Citation: imdb]'
+        )
+
+        result = openai_provider._extract_json(response)
+
+        assert result["suggestions"][0]["title"] == "Cited"
+
     def test_extract_json_malformed_json(self, openai_provider):
         """Test JSON extraction fails with malformed JSON."""
         response = MockOpenAIResponse(output_content=MALFORMED_JSON_RESPONSE)
@@ -325,27 +485,328 @@ class TestOpenAIJSONExtraction:
             openai_provider._extract_json(response)
 
 
+class TestOpenAIResponseCache:
+    """Test the on-disk response cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_discover_is_served_from_cache(
+        self, openai_provider, mock_openai_client
+    ):
+        """Test an identical second call skips the network."""
+        mock_openai_client.responses.create.return_value = MockOpenAIResponse(
+            output_text=json.dumps(VALID_JSON_RESPONSE)
+        )
+
+        # Pin the prompt so a clock tick between calls cannot change the cache key
+        with patch.object(openai_provider, "_build_prompt", return_value="prompt"):
+            first = await openai_provider.discover(limit=2, region="US")
+            second = await openai_provider.discover(limit=2, region="US")
+
+        assert mock_openai_client.responses.create.call_count == 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_cache_survives_hour_rollover(self, mock_openai_client, tmp_path):
+        """Test a new hour's prompt reuses the entry instead of writing another file."""
+        provider = OpenAIProvider(
+            api_key="test-key",
+            model="gpt-4o-mini",
+            region="US",
+            cache_ttl_hours=6,
+            client=mock_openai_client,
+            cache_dir=tmp_path / "openai",
+        )
+        mock_openai_client.responses.create.return_value = MockOpenAIResponse(
+            output_text=json.dumps(VALID_JSON_RESPONSE)
+        )
+
+        with patch.object(provider, "_build_prompt", side_effect=["10:00 UTC", "11:00 UTC"]):
+            await provider.discover(limit=2)
+            openai_provider_module._RESPONSE_CACHE.clear()
+            await provider.discover(limit=2)
+
+        assert mock_openai_client.responses.create.call_count == 1
+        assert len(list((tmp_path / "openai").glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_files_are_pruned(self, mock_openai_client, tmp_path):
+        """Test writing an entry deletes files older than the TTL."""
+        cache_dir = tmp_path / "openai"
+        cache_dir.mkdir()
+        stale = cache_dir / "stale.json"
+        stale.write_text("[]")
+        old = time.time() - 7 * 3600
+        os.utime(stale, (old, old))
+        provider = OpenAIProvider(
+            api_key="test-key",
+            model="gpt-4o-mini",
+            region="US",
+            cache_ttl_hours=6,
+            client=mock_openai_client,
+            cache_dir=cache_dir,
+        )
+        mock_openai_client.responses.create.return_value = MockOpenAIResponse(
+            output_text=json.dumps(EMPTY_SUGGESTIONS_RESPONSE)
+        )
+
+        await provider.discover(limit=1)
+
+        assert not stale.exists()
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_in_process_cache_is_shared_across_providers(self, mock_openai_client, tmp_path):
+        """Test a second provider hits the in-memory tier even without the disk entry."""
+        mock_openai_client.responses.create.return_value = MockOpenAIResponse(
+            output_text=json.dumps(VALID_JSON_RESPONSE)
+        )
+        providers = [
+            OpenAIProvider(
+                api_key="test-key",
+                model="gpt-4o-mini",
+                region="US",
+                cache_ttl_hours=6,
+                client=mock_openai_client,
+                cache_dir=tmp_path / name,
+            )
+            for name in ("first", "second")
+        ]
+
+        with patch("radarr_manager.providers.openai._build_user_prompt", return_value="prompt"):
+            first = await providers[0].discover(limit=2)
+            second = await providers[1].discover(limit=2)
+
+        assert mock_openai_client.responses.create.call_count == 1
+        assert second == first
+        assert second is not first
+        assert not (tmp_path / "second").exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_discover_issues_one_request(
+        self, openai_provider, mock_openai_client
+    ):
+        """Test concurrent identical calls collapse into one upstream request."""
+        mock_openai_client.responses.create.return_value = MockOpenAIResponse(
+            output_text=json.dumps(VALID_JSON_RESPONSE)
+        )
+
+        with patch.object(openai_provider, "_build_prompt", return_value="prompt"):
+            results = await asyncio.gather(
+                openai_provider.discover(limit=2), openai_provider.discover(limit=2)
+            )
+
+        assert mock_openai_client.responses.create.call_count == 1
+        assert results[0] == results[1]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failure_is_shared_without_cache(self, mock_openai_client):
+        """Test in-flight coalescing works without the disk cache and shares errors."""
+        provider = OpenAIProvider(
+            api_key="test-key",
+            model="gpt-4o-mini",
+            region="US",
+            cache_ttl_hours=0,
+            client=mock_openai_client,
+        )
+
+        async def rate_limited(**kwargs):
+            await asyncio.sleep(0)
+            raise RuntimeError("rate limited")
+
+        mock_openai_client.responses.create.side_effect = rate_limited
+
+        with patch.object(provider, "_build_prompt", return_value="prompt"):
+            results = await asyncio.gather(
+                provider.discover(limit=1), provider.discover(limit=1), return_exceptions=True
+            )
+
+        assert mock_openai_client.responses.create.call_count == 1
+        assert all(isinstance(r, ProviderError) for r in results)
+        assert provider._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(
+        self, openai_provider, mock_openai_client
+    ):
+        """Test cancelling the first caller fails waiters with ProviderError, not cancellation."""
+        started = asyncio.Event()
+
+        async def slow_request(**kwargs):
+            started.set()
+            await asyncio.Event().wait()
+
+        mock_openai_client.responses.create.side_effect = slow_request
+
+        with patch.object(openai_provider, "_build_prompt", return_value="prompt"):
+            leader = asyncio.create_task(openai_provider.discover(limit=2))
+            await started.wait()
+            waiter = asyncio.create_task(openai_provider.discover(limit=2))
+            await asyncio.sleep(0)
+            leader.cancel()
+
+            with pytest.raises(ProviderError, match="cancelled"):
+                await waiter
+
+        assert leader.cancelled()
+        assert openai_provider._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self, mock_openai_client, tmp_path):
+        """Test cache_ttl_hours=0 always queries OpenAI and writes nothing."""
+        provider = OpenAIProvider(
+            api_key="test-key",
+            model="gpt-4o-mini",
+            region="US",
+            cache_ttl_hours=0,
+            client=mock_openai_client,
+            cache_dir=tmp_path / "openai",
+        )
+        mock_openai_client.responses.create.return_value = MockOpenAIResponse(
+            output_text=json.dumps(EMPTY_SUGGESTIONS_RESPONSE)
+        )
+
+        await provider.discover(limit=1)
+        await provider.discover(limit=1)
+
+        assert mock_openai_client.responses.create.call_count == 2
+        assert not (tmp_path / "openai").exists()
+
+
+class TestOpenAIDiscoverParallel:
+    """Test multi-region parallel discovery."""
+
+    @pytest.mark.asyncio
+    async def test_merges_regions_and_skips_failures(self, openai_provider):
+        """Test duplicates across regions collapse and a failed region is skipped."""
+        dune = MovieSuggestion(title="Dune", release_date="2024-03-01")
+
+        async def fake_discover(*, limit, region=None):
+            if region == "EU":
+                raise ProviderError("boom")
+            extra = MovieSuggestion(title=f"Only {region}")
+            return [dune.model_copy(update={"title": "DUNE"}) if region == "CA" else dune, extra]
+
+        with patch.object(openai_provider, "discover", side_effect=fake_discover) as discover:
+            result = await openai_provider.discover_parallel(limit=5, regions=["US", "CA", "EU"])
+
+        assert [s.title for s in result] == ["Dune", "Only US", "Only CA"]
+        assert {call.kwargs["limit"] for call in discover.call_args_list} == {2}
+
+    @pytest.mark.asyncio
+    async def test_raises_when_every_region_fails(self, openai_provider):
+        """Test the first error surfaces when no region succeeds."""
+        with patch.object(openai_provider, "discover", side_effect=ProviderError("down")):
+            with pytest.raises(ProviderError, match="down"):
+                await openai_provider.discover_parallel(limit=4, regions=["US", "EU"])
+
+
+class TestOpenAIDiscoverStream:
+    """Test streaming discovery."""
+
+    STREAMED_TEXT = (
+        '```json\n{"suggestions": [{"title": "First {One}", "sources": ["a"]}, '
+        '{"title": "Second \\"Two\\""}], "notes": [{"title": "ignored"}]}```'
+    )
+
+    def test_parser_handles_arbitrary_chunk_boundaries(self):
+        """Test items are emitted identically however the text is split."""
+        for size in (1, 3, len(self.STREAMED_TEXT)):
+            parser = _SuggestionStreamParser()
+            items = []
+            for i in range(0, len(self.STREAMED_TEXT), size):
+                items.extend(parser.feed(self.STREAMED_TEXT[i : i + size]))
+
+            assert [item["title"] for item in items] == ["First {One}", 'Second "Two"']
+
+    @pytest.mark.asyncio
+    async def test_discover_stream_yields_suggestions(self, openai_provider, mock_openai_client):
+        """Test suggestions are yielded from text delta events."""
+
+        async def events():
+            yield SimpleNamespace(type="response.created")
+            for i in range(0, len(self.STREAMED_TEXT), 10):
+                yield SimpleNamespace(
+                    type="response.output_text.delta", delta=self.STREAMED_TEXT[i : i + 10]
+                )
+
+        mock_openai_client.responses.create.return_value = events()
+
+        titles = [s.title async for s in openai_provider.discover_stream(limit=2)]
+
+        assert titles == ["First {One}", 'Second "Two"']
+        assert mock_openai_client.responses.create.call_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "event,match",
+        [
+            (
+                SimpleNamespace(
+                    type="response.incomplete",
+                    response=SimpleNamespace(
+                        status="incomplete", incomplete_details="max_output_tokens"
+                    ),
+                ),
+                "status=incomplete",
+            ),
+            (
+                SimpleNamespace(
+                    type="response.failed",
+                    response=SimpleNamespace(status="failed", error="server_error"),
+                ),
+                "status=failed",
+            ),
+            (SimpleNamespace(type="error", message="rate limited"), "rate limited"),
+        ],
+    )
+    async def test_discover_stream_raises_on_failed_stream(
+        self, openai_provider, mock_openai_client, event, match
+    ):
+        """Test failed, truncated or errored streams raise instead of ending quietly."""
+
+        async def events():
+            yield SimpleNamespace(type="response.output_text.delta", delta=self.STREAMED_TEXT[:60])
+            yield event
+
+        mock_openai_client.responses.create.return_value = events()
+
+        with pytest.raises(ProviderError, match=match):
+            [s async for s in openai_provider.discover_stream(limit=2)]
+
+
 class TestOpenAIBuildPrompt:
     """Test prompt building functionality."""
 
+    def test_static_prompts_are_ascii(self):
+        """Test the static prompts need no \\u escapes when the SDK JSON-encodes them."""
+        assert SYSTEM_PROMPT.isascii()
+        assert USER_PROMPT_PREFIX.isascii()
+
+    def test_build_prompt_is_stable_within_the_hour(self, openai_provider):
+        """Test calls in the same hour produce the identical (memoized) prompt."""
+        start = datetime(2024, 9, 19, 16, 1, tzinfo=UTC).timestamp()
+        with patch("radarr_manager.providers.openai.time.time", side_effect=[start, start + 3000]):
+            first = openai_provider._build_prompt(limit=5, region="US")
+            second = openai_provider._build_prompt(limit=5, region="US")
+
+        assert first is second
+
     def test_build_prompt_includes_all_parameters(self, openai_provider):
         """Test that build_prompt includes all required parameters."""
-        with patch("radarr_manager.providers.openai.datetime") as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = "2024-09-19 16:30 UTC"
-
+        now = datetime(2024, 9, 19, 16, 30, tzinfo=UTC).timestamp()
+        with patch("radarr_manager.providers.openai.time.time", return_value=now):
             prompt = openai_provider._build_prompt(limit=5, region="EU")
 
             assert "web_search" in prompt
             assert "theatrical movies" in prompt
             assert "Max 5 movies" in prompt
             assert "region EU" in prompt
-            assert "2024-09-19 16:30 UTC" in prompt
+            assert "2024-09-19 16:00 UTC" in prompt
 
     def test_build_prompt_different_parameters(self, openai_provider):
         """Test prompt building with different parameters."""
-        with patch("radarr_manager.providers.openai.datetime") as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = "2024-12-25 12:00 UTC"
-
+        now = datetime(2024, 12, 25, 12, 0, tzinfo=UTC).timestamp()
+        with patch("radarr_manager.providers.openai.time.time", return_value=now):
             prompt = openai_provider._build_prompt(limit=10, region="CA")
 
             assert "Max 10 movies" in prompt
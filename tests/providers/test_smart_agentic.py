@@ -0,0 +1,81 @@
+"""Tests for the smart agentic discovery provider."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from radarr_manager.models import MovieSuggestion
+from radarr_manager.providers import smart_agentic
+from radarr_manager.providers.smart_agentic import SmartAgenticProvider
+
+
+class TestWithPrompt:
+    """Test prompt swapping."""
+
+    def test_with_prompt_reuses_orchestrator(self):
+        """Test the clone shares the orchestrator and only swaps the prompt."""
+        provider = SmartAgenticProvider(discovery_prompt="original")
+
+        clone = provider.with_prompt("Find 10 horror movies for Halloween")
+
+        assert clone is not provider
+        assert clone._orchestrator is provider._orchestrator
+        assert clone._discovery_prompt == "Find 10 horror movies for Halloween"
+        assert provider._discovery_prompt == "original"
+
+
+class TestDiscoverCache:
+    """Test reuse of orchestrator results."""
+
+    @pytest.mark.asyncio
+    async def test_case_and_whitespace_variants_hit_cache(self):
+        """Test case/whitespace variants of a prompt skip the orchestrator."""
+        provider = SmartAgenticProvider(discovery_prompt="Find 10 horror movies for Halloween")
+        provider._orchestrator = AsyncMock()
+        provider._orchestrator.discover.return_value = [MovieSuggestion(title="Halloween")]
+
+        first = await provider.discover(limit=10)
+        second = await provider.with_prompt(" find 10  horror movies\nfor HALLOWEEN").discover(
+            limit=10
+        )
+
+        assert [s.title for s in first] == [s.title for s in second] == ["Halloween"]
+        assert provider._orchestrator.discover.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_orchestrates(self):
+        """Test a zero TTL sends every call to the orchestrator."""
+        provider = SmartAgenticProvider(discovery_prompt="horror", cache_ttl_seconds=0)
+        provider._orchestrator = AsyncMock()
+        provider._orchestrator.discover.return_value = [MovieSuggestion(title="Halloween")]
+
+        await provider.discover(limit=5)
+        await provider.discover(limit=5)
+
+        assert provider._orchestrator.discover.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_punctuation_changes_the_key(self):
+        """Test prompts differing only in operators are not served each other's results."""
+        provider = SmartAgenticProvider(discovery_prompt="rating > 7")
+        provider._orchestrator = AsyncMock()
+        provider._orchestrator.discover.return_value = [MovieSuggestion(title="Alien")]
+
+        await provider.discover(limit=5)
+        await provider.with_prompt("rating < 7").discover(limit=5)
+
+        assert provider._orchestrator.discover.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, monkeypatch):
+        """Test the cache stays bounded and keeps recently hit prompts."""
+        monkeypatch.setattr(smart_agentic, "_CACHE_MAX_ENTRIES", 2)
+        provider = SmartAgenticProvider(discovery_prompt="a")
+        provider._orchestrator = AsyncMock()
+        provider._orchestrator.discover.return_value = [MovieSuggestion(title="Alien")]
+
+        for prompt in ("a", "b", "a", "c"):
+            await provider.with_prompt(prompt).discover(limit=5)
+
+        assert [key[0] for key in provider._cache] == ["a", "c"]
+        assert provider._orchestrator.discover.await_count == 3
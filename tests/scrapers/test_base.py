@@ -0,0 +1,122 @@
+"""Tests for the shared scraper discovery flow and scraper factory."""
+
+import asyncio
+
+import pytest
+
+from radarr_manager.scrapers.base import ScrapedMovie, ScraperError, ScraperProvider
+from radarr_manager.scrapers.factory import build_scraper
+
+
+class FakeScraper(ScraperProvider):
+    """Scraper returning canned results per URL fragment."""
+
+    name = "fake"
+
+    def __init__(self, results: dict[str, list[ScrapedMovie] | Exception]):
+        self._results = results
+        self.active = 0
+        self.max_active = 0
+        self.closed = 0
+
+    async def close(self) -> None:
+        self.closed += 1
+
+    async def scrape_movies(self, url: str) -> list[ScrapedMovie]:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        for fragment, result in self._results.items():
+            if fragment in url:
+                if isinstance(result, Exception):
+                    raise result
+                return result
+        return []
+
+
+class TestDiscoverAll:
+    """Test combined discovery across the configured sources."""
+
+    @pytest.mark.asyncio
+    async def test_sources_are_fetched_concurrently(self):
+        """Test all sources are in flight at the same time."""
+        scraper = FakeScraper({})
+
+        await scraper.discover_all()
+
+        assert scraper.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_dedup_keeps_source_order_and_skips_failures(self):
+        """Test first-source-wins dedup and that a failing source is skipped."""
+        scraper = FakeScraper(
+            {
+                "movies_in_theaters": [ScrapedMovie(title="Weapons", source="")],
+                "movies_at_home": ScraperError("blocked"),
+                "imdb.com": [
+                    ScrapedMovie(title=" WEAPONS ", source=""),
+                    ScrapedMovie(title="Nobody 2", source=""),
+                ],
+            }
+        )
+
+        movies = await scraper.discover_all()
+
+        assert [(m.title, m.source) for m in movies] == [
+            ("Weapons", "rt_theaters"),
+            ("Nobody 2", "imdb_moviemeter"),
+        ]
+
+
+class TestScrapeMany:
+    """Test bounded concurrent scraping of arbitrary URLs."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_and_failures_skipped(self):
+        """Test the semaphore caps in-flight scrapes and results keep URL order."""
+        scraper = FakeScraper(
+            {
+                "/a": [ScrapedMovie(title="A", source="")],
+                "/b": ScraperError("blocked"),
+                "/c": [ScrapedMovie(title="C", source="")],
+            }
+        )
+        urls = [f"https://example.com/{name}" for name in "abcdef"]
+
+        movies = await scraper.scrape_many(urls, concurrency=2)
+
+        assert [m.title for m in movies] == ["A", "C"]
+        assert scraper.max_active == 2
+
+
+class TestScraperContext:
+    """Test closing scrapers shared by several ``async with`` blocks."""
+
+    @pytest.mark.asyncio
+    async def test_closed_when_last_user_exits(self):
+        """Test nested users keep the scraper open until the outermost block exits."""
+        scraper = FakeScraper({})
+
+        async with scraper:
+            async with scraper:
+                pass
+            assert scraper.closed == 0
+
+        assert scraper.closed == 1
+
+
+class TestBuildScraper:
+    """Test scraper construction from a provider name."""
+
+    def test_known_provider_uses_default_url(self):
+        """Test provider names are case-insensitive and default URLs apply."""
+        scraper = build_scraper(provider="Firecrawl")
+
+        assert scraper.name == "firecrawl"
+        assert scraper._api_url == "http://localhost:3002"
+
+    def test_unknown_provider_raises(self):
+        """Test an unsupported provider lists the valid options."""
+        with pytest.raises(ScraperError, match="crawl4ai, firecrawl"):
+            build_scraper(provider="selenium")
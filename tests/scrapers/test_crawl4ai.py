@@ -0,0 +1,204 @@
+"""Tests for the Crawl4AI scraper."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from radarr_manager.scrapers.crawl4ai import Crawl4AIScraper
+
+RT_CONTENT = """
+[ 95% 88% Sinners Opened Apr 18, 2025 ](https://www.rottentomatoes.com/m/sinners_2025)
+[ 91% Weapons Link to Weapons ](https://www.rottentomatoes.com/m/weapons)
+[ 80% Sinners Opened Apr 18, 2025 ](https://www.rottentomatoes.com/m/sinners_2025)
+[ 75% Trailer Opens May 2, 2025 ](https://www.rottentomatoes.com/m/trailer)
+"""
+
+IMDB_CONTENT = """
+### [The Long Walk](https://www.imdb.com/title/tt1234567/?ref_=chtmvm_t_1)
+### [Rating Breakdown](https://www.imdb.com/title/tt7654321/?ref_=chtmvm_t_2)
+### [Too Low](https://www.imdb.com/title/tt1111111/?ref_=chtmvm_t_101)
+"""
+
+
+class TestCrawl4AIParsers:
+    """Test title extraction from Crawl4AI markdown."""
+
+    def test_parse_rt_content(self):
+        """Test RT links yield cleaned, deduplicated titles."""
+        scraper = Crawl4AIScraper()
+
+        movies = scraper._parse_rt_content(RT_CONTENT, "https://rt")
+
+        assert [(m.title, m.year) for m in movies] == [("Sinners", 2025), ("Weapons", None)]
+        assert all(m.source == "rt" for m in movies)
+
+    def test_parse_rt_content_backfills_year(self):
+        """Test a dated link fills in the year of an earlier undated match."""
+        scraper = Crawl4AIScraper()
+        content = (
+            "[ 91% Weapons Link to Weapons ](https://www.rottentomatoes.com/m/weapons)\n"
+            "[ 91% Weapons Opened Aug 8, 2025 ](https://www.rottentomatoes.com/m/weapons)"
+        )
+
+        movies = scraper._parse_rt_content(content, "https://rt")
+
+        assert [(m.title, m.year) for m in movies] == [("Weapons", 2025)]
+
+    def test_parse_imdb_content(self):
+        """Test IMDB headers keep rank and skip invalid or low-ranked titles."""
+        scraper = Crawl4AIScraper()
+
+        movies = scraper._parse_imdb_content(IMDB_CONTENT, "https://imdb")
+
+        assert [m.title for m in movies] == ["The Long Walk"]
+        assert movies[0].extra == {"rank": 1}
+
+    def test_parsers_skip_content_without_links(self):
+        """Test pages without the required links short-circuit to no results."""
+        scraper = Crawl4AIScraper()
+
+        assert scraper._parse_rt_content("<div>Sinners Opened Apr 18, 2025</div>", "u") == []
+        assert scraper._parse_imdb_content("### The Long Walk", "u") == []
+
+    def test_parse_generic_content(self):
+        """Test the generic Title (Year) pattern."""
+        scraper = Crawl4AIScraper()
+
+        movies = scraper._parse_generic_content("Nosferatu (2024)\n90% score (2024)", "u")
+
+        assert [(m.title, m.year) for m in movies] == [("Nosferatu", 2024)]
+
+    def test_clean_title(self):
+        """Test markdown emphasis, trailing punctuation and extra spaces are removed."""
+        scraper = Crawl4AIScraper()
+
+        assert scraper._clean_title("**The  Long_Walk**.") == "The LongWalk"
+
+    def test_is_valid_title(self):
+        """Test obvious non-titles are rejected."""
+        scraper = Crawl4AIScraper()
+
+        assert scraper._is_valid_title("Jaws")
+        assert scraper._is_valid_title("F1")
+        assert not scraper._is_valid_title("2025")
+        assert not scraper._is_valid_title("Watch Now")
+        assert not scraper._is_valid_title("97% Fresh")
+        assert not scraper._is_valid_title("X")
+
+
+class TestCrawl4AIClient:
+    """Test HTTP client reuse."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_and_closed(self):
+        """Test repeated fetches share one client that close() releases."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200, json={"success": True, "results": [{"markdown": "Nosferatu (2024)"}]}
+            )
+
+        async with Crawl4AIScraper() as scraper:
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            scraper._clients[asyncio.get_running_loop()] = client
+
+            await scraper.scrape_movies("https://example.com/a")
+            await scraper.scrape_movies("https://example.com/b")
+
+            assert scraper._get_client() is client
+            assert len(requests) == 2
+
+        assert not scraper._clients
+        assert client.is_closed
+
+    def test_each_event_loop_gets_its_own_client(self):
+        """Test a later asyncio.run does not reuse a pool bound to a finished loop."""
+        scraper = Crawl4AIScraper()
+
+        async def get_clients():
+            return scraper._get_client(), scraper._get_client()
+
+        first, same = asyncio.run(get_clients())
+        second, _ = asyncio.run(get_clients())
+
+        assert first is same
+        assert second is not first
+
+
+class TestCrawl4AICache:
+    """Test per-URL result caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_url_served_from_cache(self):
+        """Test a second scrape of the same URL skips the fetch until cleared."""
+        scraper = Crawl4AIScraper()
+        calls = []
+
+        async def fetch(url):
+            calls.append(url)
+            return "Nosferatu (2024)"
+
+        scraper._fetch_page = fetch
+
+        first = await scraper.scrape_movies("https://example.com")
+        second = await scraper.scrape_movies("https://example.com")
+        scraper.clear_cache()
+        await scraper.scrape_movies("https://example.com")
+
+        assert [m.title for m in first] == [m.title for m in second] == ["Nosferatu"]
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_discover_all_does_not_relabel_cached_movies(self):
+        """Test discover_all's source labels don't leak into later cache hits."""
+        scraper = Crawl4AIScraper()
+        url = "https://www.rottentomatoes.com/browse/movies_in_theaters/sort:popular"
+
+        async def fetch(fetched_url):
+            return RT_CONTENT if fetched_url == url else ""
+
+        scraper._fetch_page = fetch
+
+        discovered = await scraper.discover_all()
+        cached = await scraper.scrape_movies(url)
+
+        assert {m.source for m in discovered} == {"rt_theaters"}
+        assert cached and {m.source for m in cached} == {"rt"}
+
+
+class TestCrawl4AIDispatch:
+    """Test choosing a parser from the URL."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "url,parser",
+        [
+            ("https://www.rottentomatoes.com/browse/movies_in_theaters", "_parse_rt_content"),
+            ("https://m.imdb.com/chart/moviemeter", "_parse_imdb_content"),
+            ("https://example.com/?ref=imdb.com", "_parse_generic_content"),
+        ],
+    )
+    async def test_parser_chosen_by_domain(self, url, parser):
+        """Test the site's domain, not a substring of the URL, picks the parser."""
+        scraper = Crawl4AIScraper()
+        calls = []
+
+        async def fetch(url):
+            return ""
+
+        def record(name):
+            return lambda content, url: calls.append(name) or []
+
+        scraper._fetch_page = fetch
+        scraper._parsers = {
+            "rottentomatoes.com": record("_parse_rt_content"),
+            "imdb.com": record("_parse_imdb_content"),
+        }
+        scraper._parse_generic_content = record("_parse_generic_content")
+
+        await scraper.scrape_movies(url)
+
+        assert calls == [parser]
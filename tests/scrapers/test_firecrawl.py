@@ -0,0 +1,131 @@
+"""Tests for the Firecrawl scraper."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from radarr_manager.scrapers.firecrawl import FirecrawlScraper
+
+RT_CONTENT = """Sign In (2024)
+  Sinners (2025)
+Home Alone (1990)
+[Weapons](/m/weapons) and [Second Link](/m/second)
+Anora (2024) [Ignored Link](/m/ignored)
+[97% Fresh](/m/fresh)
+Tomatometer [Skipped](/m/skipped)
+"""
+
+
+class TestFirecrawlParsers:
+    """Test title extraction from Firecrawl markdown."""
+
+    def test_parse_rt_content(self):
+        """Test RT lines yield one title each and navigation lines are skipped."""
+        scraper = FirecrawlScraper()
+
+        movies = scraper._parse_rt_content(RT_CONTENT, "https://rt")
+
+        assert [(m.title, m.year) for m in movies] == [
+            ("Sinners", 2025),
+            ("Weapons", None),
+            ("Anora", 2024),
+        ]
+        assert all(m.source == "rt" for m in movies)
+
+    def test_parse_imdb_content(self):
+        """Test ranked lines and table rows are parsed and header cells skipped."""
+        scraper = FirecrawlScraper()
+        content = (
+            "1. The Long Walk (2025)\n"
+            "| Title (2024) | Score |\n"
+            "| Nobody 2 (2025) | 7.1 |\n"
+        )
+
+        movies = scraper._parse_imdb_content(content, "https://imdb")
+
+        assert [(m.title, m.year) for m in movies] == [
+            ("The Long Walk", 2025),
+            ("Nobody 2", 2025),
+        ]
+        assert movies[0].extra == {"rank": 1}
+
+
+class TestFirecrawlClient:
+    """Test HTTP client reuse."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_and_closed(self):
+        """Test repeated fetches share one client that close() releases."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"success": True, "data": {"markdown": ""}})
+
+        async with FirecrawlScraper() as scraper:
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            scraper._clients[asyncio.get_running_loop()] = client
+
+            await scraper.scrape_movies("https://example.com/a")
+            await scraper.scrape_movies("https://example.com/b")
+
+            assert scraper._get_client() is client
+            assert len(requests) == 2
+
+        assert not scraper._clients
+        assert client.is_closed
+
+    def test_each_event_loop_gets_its_own_client(self):
+        """Test a later asyncio.run does not reuse a pool bound to a finished loop."""
+        scraper = FirecrawlScraper()
+
+        async def get_clients():
+            return scraper._get_client(), scraper._get_client()
+
+        first, same = asyncio.run(get_clients())
+        second, _ = asyncio.run(get_clients())
+
+        assert first is same
+        assert second is not first
+
+
+class TestFirecrawlCache:
+    """Test per-URL result caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_url_served_from_cache(self):
+        """Test a second scrape of the same URL skips the fetch until cleared."""
+        scraper = FirecrawlScraper()
+        calls = []
+
+        async def fetch(url):
+            calls.append(url)
+            return "Nosferatu (2024)"
+
+        scraper._fetch_page = fetch
+
+        first = await scraper.scrape_movies("https://example.com")
+        second = await scraper.scrape_movies("https://example.com")
+        scraper.clear_cache()
+        await scraper.scrape_movies("https://example.com")
+
+        assert [m.title for m in first] == [m.title for m in second] == ["Nosferatu"]
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_discover_all_does_not_relabel_cached_movies(self):
+        """Test discover_all's source labels don't leak into later cache hits."""
+        scraper = FirecrawlScraper()
+        url = "https://www.rottentomatoes.com/browse/movies_in_theaters/sort:popular"
+
+        async def fetch(fetched_url):
+            return RT_CONTENT if fetched_url == url else ""
+
+        scraper._fetch_page = fetch
+
+        discovered = await scraper.discover_all()
+        cached = await scraper.scrape_movies(url)
+
+        assert {m.source for m in discovered} == {"rt_theaters"}
+        assert cached and {m.source for m in cached} == {"rt"}
@@ -0,0 +1,102 @@
+"""Tests for the deep analysis service."""
+
+import pytest
+
+from radarr_manager.models import MovieSuggestion
+from radarr_manager.services.analysis import DeepAnalysisService
+
+
+@pytest.fixture
+def service():
+    """Create a DeepAnalysisService instance."""
+    return DeepAnalysisService()
+
+
+class TestMajorFranchise:
+    """Test major franchise detection."""
+
+    @pytest.mark.parametrize(
+        "franchise,expected",
+        [
+            ("Marvel Cinematic Universe", True),
+            ("STAR WARS saga", True),
+            ("Paddington Bear", True),
+            ("Indie Darlings", False),
+            (None, False),
+        ],
+    )
+    def test_keyword_substring_match(self, service, franchise, expected):
+        """Test franchises match any keyword case-insensitively as a substring."""
+        movie = MovieSuggestion(title="Movie", franchise=franchise)
+
+        assert service._is_major_franchise(movie) is expected
+
+
+class TestAnalyzeMovie:
+    """Test end-to-end analysis of a single movie."""
+
+    @pytest.mark.asyncio
+    async def test_well_rated_movie_is_added(self, service):
+        """Test strong multi-source ratings yield a recommendation to add."""
+        movie = MovieSuggestion(
+            title="Sinners",
+            confidence=0.9,
+            metadata={
+                "imdb_rating": 7.9,
+                "imdb_votes": 120000,
+                "rt_critics_score": 97,
+                "rt_audience_score": 96,
+                "metacritic_score": 84,
+            },
+        )
+
+        analysis = await service.analyze_movie(movie)
+
+        assert analysis.should_add is True
+        assert analysis.red_flags == []
+        assert analysis.quality_score == 10
+        assert analysis.rating_details["rt_critics_score"] == 97
+
+    @pytest.mark.asyncio
+    async def test_unrated_movie_uses_confidence(self, service):
+        """Test a movie with no ratings falls back to discovery confidence."""
+        movie = MovieSuggestion(title="Unreleased", confidence=0.72)
+
+        analysis = await service.analyze_movie(movie)
+
+        assert analysis.quality_score == 5.5
+        assert analysis.should_add is False
+        assert "No ratings available - unreleased or unreviewed" in analysis.red_flags
+
+    @pytest.mark.asyncio
+    async def test_regional_cinema_requires_high_imdb(self, service):
+        """Test regional-language films below the IMDb bar are skipped."""
+        movie = MovieSuggestion(
+            title="Regional",
+            confidence=0.9,
+            metadata={
+                "imdb_rating": 7.5,
+                "imdb_votes": 60000,
+                "rt_critics_score": 90,
+                "rt_audience_score": 88,
+                "original_language": "Hindi",
+            },
+        )
+
+        analysis = await service.analyze_movie(movie)
+
+        assert analysis.should_add is False
+        assert analysis.red_flags[-1].startswith("Regional cinema (Hindi)")
+
+
+class TestAnalyzeMovies:
+    """Test batch analysis."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self, service):
+        """Test each analysis lines up with the movie at the same index."""
+        movies = [MovieSuggestion(title=f"Movie {i}", confidence=0.9) for i in range(5)]
+
+        analyses = await service.analyze_movies(movies, max_concurrency=2)
+
+        assert [a.movie.title for a in analyses] == [m.title for m in movies]